@@ -0,0 +1,106 @@
+"""
+Compare le chargement d'une liste de tâches :
+- chemin ORM (instances TaskTable puis copie dans une Task, ancien adapter)
+- chemin Core (tuples de select(*TASK_COLUMNS) -> Task, adapter actuel)
+ainsi que la taille d'une Task avec __slots__ et avec un __dict__.
+
+Usage : python benchmarks/bench_row_mapping.py [--rows 100000]
+"""
+import argparse
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from todo.adapters.persistence.sqlite_repository import (
+    SQLiteTaskRepository,
+    TaskTable,
+    get_engine,
+    list_query,
+    to_task,
+)
+from todo.domain.task import Task, TaskStatus
+
+
+class DictTask:
+    """Task d'avant __slots__ (attributs dans un __dict__), pour comparer la mémoire."""
+
+    def __init__(self, id, title, description=None, status=TaskStatus.IN_PROGRESS, due_date=None):
+        self.id = id
+        self.title = title
+        self.description = description
+        self.status = status
+        self.due_date = due_date
+
+
+def load_orm(engine, task_class=Task):
+    with Session(engine) as session:
+        return [
+            task_class(
+                id=orm_task.id,
+                title=orm_task.title,
+                description=orm_task.description,
+                status=TaskStatus(orm_task.status),
+                due_date=orm_task.due_date,
+            )
+            for orm_task in session.scalars(select(TaskTable).order_by(TaskTable.id))
+        ]
+
+
+def load_core(engine):
+    with engine.connect() as conn:
+        return [to_task(row) for row in conn.execute(list_query())]
+
+
+def load_core_dict(engine):
+    with engine.connect() as conn:
+        return [
+            DictTask(task_id, title, description, TaskStatus(status), due_date)
+            for task_id, title, description, status, due_date in conn.execute(list_query())
+        ]
+
+
+def measure(label, load, engine):
+    # Temps sans tracemalloc (qui ralentit les allocations), puis pic mémoire à part
+    start = time.perf_counter()
+    tasks = load(engine)
+    elapsed = time.perf_counter() - start
+    del tasks
+
+    tracemalloc.start()
+    tasks = load(engine)
+    _, peak = tracemalloc.get_traced_memory()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(
+        f"{label:<28} {len(tasks) / elapsed:>12,.0f} rows/s"
+        f"   peak {peak / 2**20:>7.1f} MiB   kept {retained / 2**20:>7.1f} MiB"
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        repository = SQLiteTaskRepository(url)
+        repository.add_many(
+            [Task(id=0, title=f"Tâche {i}", description="Description de test") for i in range(args.rows)]
+        )
+        engine = get_engine(url)
+
+        print(f"{args.rows:,} tâches")
+        measure("ORM -> Task (__dict__)", lambda e: load_orm(e, DictTask), engine)
+        measure("ORM -> Task (__slots__)", load_orm, engine)
+        measure("Core -> Task (__dict__)", load_core_dict, engine)
+        measure("Core -> Task (__slots__)", load_core, engine)
+
+
+if __name__ == "__main__":
+    main()
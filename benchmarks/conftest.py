@@ -0,0 +1,61 @@
+"""
+Fixtures des benchmarks : bases SQLite temporaires de 1k, 100k et 1M tâches.
+
+    poetry run pytest benchmarks --benchmark-autosave        # enregistre une baseline
+    poetry run pytest benchmarks --benchmark-compare         # compare à la dernière
+    poetry run pytest benchmarks --sizes 1000,100000         # sans la base de 1M
+"""
+import tracemalloc
+
+import pytest
+
+from todo.adapters.persistence.sqlite_repository import SQLiteTaskRepository
+from seed import seed_database
+
+DEFAULT_SIZES = "1000,100000,1000000"
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--sizes",
+        default=DEFAULT_SIZES,
+        help=f"Tailles des bases à générer, séparées par des virgules (défaut : {DEFAULT_SIZES})",
+    )
+
+
+def pytest_generate_tests(metafunc):
+    if "size" in metafunc.fixturenames:
+        sizes = [int(size) for size in metafunc.config.getoption("sizes").split(",")]
+        metafunc.parametrize("size", sizes, scope="session", ids=lambda size: f"{size:_}")
+
+
+@pytest.fixture(scope="session")
+def database_url(size, tmp_path_factory):
+    """Base générée une fois par taille pour toute la session."""
+    path = tmp_path_factory.mktemp(f"bench_{size}") / "todo.db"
+    url = f"sqlite:///{path}"
+    seed_database(url, size)
+    return url
+
+
+@pytest.fixture
+def repository(database_url):
+    return SQLiteTaskRepository(database_url)
+
+
+@pytest.fixture
+def peak_memory(benchmark):
+    """
+    Rejoue une fois l'opération sous tracemalloc (hors mesure de temps) et
+    enregistre le pic dans extra_info, sauvegardé avec la baseline.
+    """
+    def measure(fn, *args, **kwargs):
+        tracemalloc.start()
+        try:
+            fn(*args, **kwargs)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        benchmark.extra_info["peak_memory_kib"] = round(peak / 1024, 1)
+
+    return measure
@@ -0,0 +1,29 @@
+"""Génération des bases de benchmark, partagée par pytest et les scripts."""
+from datetime import date, timedelta
+
+from todo.adapters.persistence.sqlite_repository import SQLiteTaskRepository
+from todo.domain.task import Task, TaskStatus
+
+SEED_BATCH = 50_000
+
+
+def seed_tasks(start: int, count: int) -> list[Task]:
+    """Données réalistes : un tiers terminées, des échéances passées et futures."""
+    today = date.today()
+    statuses = (TaskStatus.IN_PROGRESS, TaskStatus.IN_PROGRESS, TaskStatus.DONE)
+    return [
+        Task(
+            id=0,
+            title=f"Tâche {i}",
+            description=f"Description de la tâche {i}",
+            status=statuses[i % 3],
+            due_date=today + timedelta(days=i % 60 - 30) if i % 4 else None,
+        )
+        for i in range(start, start + count)
+    ]
+
+
+def seed_database(database_url: str, size: int) -> None:
+    repository = SQLiteTaskRepository(database_url)
+    for start in range(0, size, SEED_BATCH):
+        repository.add_many(seed_tasks(start, min(SEED_BATCH, size - start)))
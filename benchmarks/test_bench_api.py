@@ -0,0 +1,64 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from todo.adapters.api import api
+from todo.adapters.api.cache import ResponseCache
+from todo.adapters.notifications.notif import BufferedNotifier
+from todo.adapters.persistence.sqlite_async_repository import AsyncSQLiteTaskRepository
+
+API_KEY = "benchmark"
+HEADERS = {"X-API-Key": API_KEY}
+
+
+@pytest.fixture
+def client(request, database_url, tmp_path, monkeypatch):
+    """
+    Application FastAPI sur la base générée, via TestClient.
+    Par défaut ("cold") le cache de réponses est désactivé : chaque GET passe
+    par le repository et la sérialisation. "cached" (paramètre indirect) :
+    cache actif, les GET répétés mesurent des hits.
+    """
+    monkeypatch.setattr(api, "API_KEY", API_KEY)
+    repository = AsyncSQLiteTaskRepository(database_url)
+    notifier = BufferedNotifier(str(tmp_path / "notifications.txt"))
+    cached = getattr(request, "param", "cold") == "cached"
+    cache = ResponseCache(maxsize=256 if cached else 0)
+    api.app.dependency_overrides[api.get_repository] = lambda: repository
+    api.app.dependency_overrides[api.get_notifier] = lambda: notifier
+    api.app.dependency_overrides[api.get_response_cache] = lambda: cache
+
+    with TestClient(api.app) as client:
+        yield client
+        client.portal.call(repository.close)
+
+    notifier.close()
+    api.app.dependency_overrides.clear()
+
+
+@pytest.mark.parametrize("client", ["cold", "cached"], indirect=True)
+def test_api_get_task(benchmark, client, size, peak_memory):
+    """GET /tasks/{id}"""
+    url = f"/tasks/{size // 2}"
+    benchmark(client.get, url, headers=HEADERS)
+    peak_memory(client.get, url, headers=HEADERS)
+
+
+@pytest.mark.parametrize("client", ["cold", "cached"], indirect=True)
+def test_api_list_page(benchmark, client, size, peak_memory):
+    """GET /tasks?limit=100 au milieu de la table"""
+    url = f"/tasks?limit=100&after_id={size // 2}"
+    benchmark(client.get, url, headers=HEADERS)
+    peak_memory(client.get, url, headers=HEADERS)
+
+
+def test_api_create_task(benchmark, client, peak_memory):
+    """POST /tasks"""
+    payload = {"title": "Benchmark"}
+    benchmark(client.post, "/tasks", json=payload, headers=HEADERS)
+    peak_memory(client.post, "/tasks", json=payload, headers=HEADERS)
+
+
+def test_api_stats(benchmark, client, peak_memory):
+    """GET /tasks/stats"""
+    benchmark(client.get, "/tasks/stats", headers=HEADERS)
+    peak_memory(client.get, "/tasks/stats", headers=HEADERS)
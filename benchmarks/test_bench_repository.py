@@ -0,0 +1,79 @@
+import random
+from datetime import date
+
+from todo.application.use_cases import list_tasks
+from todo.domain.task import Task, TaskStatus
+
+
+# =========================
+# Repository SQLite
+# =========================
+
+def test_add(benchmark, repository, peak_memory):
+    """Insertion d'une tâche"""
+    def add():
+        repository.add(Task(id=0, title="Benchmark"))
+
+    benchmark(add)
+    peak_memory(add)
+
+
+def test_get(benchmark, repository, size, peak_memory):
+    """Lecture d'une tâche par id, ids tirés au hasard"""
+    ids = random.Random(0).choices(range(1, size + 1), k=1000)
+    it = iter(ids * 1000)
+
+    benchmark(lambda: repository.get(next(it)))
+    peak_memory(repository.get, ids[0])
+
+
+def test_update(benchmark, repository, size, peak_memory):
+    """Mise à jour d'une tâche (UPDATE ... RETURNING)"""
+    task = repository.get(size // 2)
+
+    def update():
+        task.title = "Benchmark" if task.title != "Benchmark" else "Benchmark bis"
+        repository.update(task)
+
+    benchmark(update)
+    peak_memory(update)
+
+
+def test_list_page(benchmark, repository, size, peak_memory):
+    """Une page de 100 tâches au milieu de la table (keyset)"""
+    benchmark(repository.list, limit=100, after_id=size // 2)
+    peak_memory(repository.list, limit=100, after_id=size // 2)
+
+
+def test_list_filtered(benchmark, repository, peak_memory):
+    """1000 tâches filtrées par statut"""
+    benchmark(repository.list, status=TaskStatus.DONE, limit=1000)
+    peak_memory(repository.list, status=TaskStatus.DONE, limit=1000)
+
+
+def test_list_all(benchmark, repository, peak_memory):
+    """Toute la table en mémoire (3 tours : coûteux à 1M)"""
+    benchmark.pedantic(repository.list, rounds=3, iterations=1)
+    peak_memory(repository.list)
+
+
+def test_count_by_status(benchmark, repository, peak_memory):
+    """Statistiques GROUP BY"""
+    benchmark(repository.count_by_status, date.today())
+    peak_memory(repository.count_by_status, date.today())
+
+
+def test_search(benchmark, repository, peak_memory):
+    """Recherche plein texte sélective"""
+    benchmark(repository.search, "tâche 4242", 20)
+    peak_memory(repository.search, "tâche 4242", 20)
+
+
+# =========================
+# Use cases
+# =========================
+
+def test_list_tasks_with_overdue_sweep(benchmark, repository, peak_memory):
+    """list_tasks : balayage des retards + page de 100"""
+    benchmark(list_tasks, repository, limit=100)
+    peak_memory(list_tasks, repository, limit=100)
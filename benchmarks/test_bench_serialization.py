@@ -0,0 +1,60 @@
+from datetime import date, timedelta
+from typing import List
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from todo.adapters.api.api import TaskOut
+from todo.adapters.api.serialization import dump_tasks, json_response
+from todo.domain.task import Task
+
+COUNT = 10_000
+
+
+# =========================
+# Sérialisation des réponses (10k tâches, sans base)
+# =========================
+# "model" : chemin d'origine, TaskOut par tâche puis revalidation et encodage
+# par response_model. "direct" : dicts typés écrits en bytes par pydantic-core.
+
+def make_tasks() -> List[Task]:
+    return [
+        Task.from_row(i, f"Tâche {i}", "d" * 115, "in_progress", date(2026, 1, 1) + timedelta(days=i % 365))
+        for i in range(1, COUNT + 1)
+    ]
+
+
+@pytest.fixture(scope="module")
+def client():
+    tasks = make_tasks()
+    app = FastAPI()
+
+    @app.get("/model", response_model=List[TaskOut])
+    def model_path():
+        return [
+            TaskOut(id=t.id, title=t.title, description=t.description, status=t.status, due_date=t.due_date)
+            for t in tasks
+        ]
+
+    @app.get("/direct", response_model=List[TaskOut])
+    def direct_path():
+        return json_response(dump_tasks(tasks))
+
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.parametrize("path", ["model", "direct"])
+def test_serialize_task_list(benchmark, client, path, peak_memory):
+    """GET de 10k tâches selon le chemin de sérialisation"""
+    benchmark.group = "serialization"
+    response = benchmark(client.get, f"/{path}")
+    peak_memory(client.get, f"/{path}")
+
+    assert len(response.json()) == COUNT
+
+
+def test_direct_matches_model_output(client):
+    """Les deux chemins produisent le même JSON"""
+    assert client.get("/direct").content == client.get("/model").content
@@ -0,0 +1,22 @@
+import asyncio
+
+from tui_harness import run_scenario
+
+
+# =========================
+# TUI sans terminal (Pilot)
+# =========================
+
+def test_tui_scenario(benchmark, database_url, tmp_path):
+    """Scénario clavier complet ; latences par méthode et par touche dans extra_info"""
+    notif_path = str(tmp_path / "notifications.txt")
+
+    summary = benchmark.pedantic(
+        lambda: asyncio.run(run_scenario(database_url, notif_path)),
+        rounds=1,
+        iterations=1,
+    )
+
+    for name, stats in summary.items():
+        for stat, value in stats.items():
+            benchmark.extra_info[f"{name}.{stat}"] = value
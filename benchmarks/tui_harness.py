@@ -0,0 +1,130 @@
+"""
+Harnais de performance de la TUI : TaskApp sans terminal (App.run_test),
+pilotée au clavier par Pilot sur une base générée.
+
+Le scénario fait défiler la liste, ouvre le menu d'actions, marque une tâche
+terminée, crée une tâche puis rafraîchit. Sont mesurées :
+- la durée de chaque appel à refresh_task_table, update_details, update_stats
+- la latence de chaque touche (envoi -> application au repos)
+
+Usage : python benchmarks/tui_harness.py [--rows 100000] [--scroll 300] [--virtual | --no-virtual]
+"""
+import argparse
+import asyncio
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from statistics import mean, quantiles
+from typing import Optional
+
+from todo.adapters.persistence.sqlite_repository import SQLiteTaskRepository
+from todo.adapters.tui.app import DETAILS_DEBOUNCE, TaskApp
+from seed import seed_database
+
+TIMED_METHODS = ("refresh_task_table", "update_details", "update_stats")
+
+
+class Recorder:
+    """Durées (en secondes) par méthode ou par touche."""
+
+    def __init__(self):
+        self.samples: dict[str, list[float]] = defaultdict(list)
+
+    def wrap(self, app: TaskApp, name: str) -> None:
+        # Attribut d'instance : les appels internes de l'app passent aussi par le chrono
+        method = getattr(app, name)
+
+        def timed(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return method(*args, **kwargs)
+            finally:
+                self.samples[name].append(time.perf_counter() - start)
+
+        setattr(app, name, timed)
+
+    def summary(self) -> dict[str, dict[str, float]]:
+        """count, mean/p95/max en millisecondes, par mesure."""
+        result = {}
+        for name, samples in self.samples.items():
+            ms = [sample * 1000 for sample in samples]
+            p95 = quantiles(ms, n=20, method="inclusive")[-1] if len(ms) > 1 else ms[0]
+            result[name] = {
+                "count": len(ms),
+                "mean_ms": round(mean(ms), 3),
+                "p95_ms": round(p95, 3),
+                "max_ms": round(max(ms), 3),
+            }
+        return result
+
+
+async def run_scenario(
+    database_url: str,
+    notif_path: str,
+    scroll: int = 300,
+    virtual: Optional[bool] = None,
+) -> dict[str, dict[str, float]]:
+    recorder = Recorder()
+    app = TaskApp(SQLiteTaskRepository(database_url), notif_path=notif_path, virtual=virtual)
+    for name in TIMED_METHODS:
+        recorder.wrap(app, name)
+
+    start = time.perf_counter()
+    async with app.run_test(size=(160, 48)) as pilot:
+        await pilot.pause()
+        recorder.samples["mount"].append(time.perf_counter() - start)
+
+        async def press(label: str, *keys: str, delay: Optional[float] = None) -> None:
+            pressed = time.perf_counter()
+            await pilot.press(*keys)
+            await pilot.pause(delay)
+            recorder.samples[f"key:{label}"].append(time.perf_counter() - pressed)
+
+        for _ in range(scroll):
+            await press("scroll", "down")
+        # Laisse passer le debounce : le détail de la dernière ligne est rendu
+        await pilot.pause(DETAILS_DEBOUNCE * 2)
+
+        await press("open_actions", "enter")
+        await press("mark_done", "down", "enter")
+
+        await press("open_create", "a")
+        for char in "bench":
+            await press("type", char)
+        await press("create", "ctrl+s")
+
+        await press("refresh", "r")
+
+    return recorder.summary()
+
+
+def print_summary(summary: dict[str, dict[str, float]]) -> None:
+    print(f"{'measure':<22} {'count':>6} {'mean ms':>10} {'p95 ms':>10} {'max ms':>10}")
+    for name, stats in summary.items():
+        print(
+            f"{name:<22} {stats['count']:>6} {stats['mean_ms']:>10.2f}"
+            f" {stats['p95_ms']:>10.2f} {stats['max_ms']:>10.2f}"
+        )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--scroll", type=int, default=300)
+    parser.add_argument("--virtual", action=argparse.BooleanOptionalAction, default=None)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        seed_database(url, args.rows)
+        summary = asyncio.run(
+            run_scenario(url, str(Path(tmp) / "notifications.txt"), args.scroll, args.virtual)
+        )
+
+    print(f"{args.rows:,} tâches, {args.scroll} lignes défilées")
+    print_summary(summary)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,28 +1,127 @@
-from datetime import date
-from typing import Optional, List
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Any, Dict, Optional, List, Tuple
 
-from fastapi import FastAPI, HTTPException, Security
+from fastapi import (
+    Body,
+    Depends,
+    FastAPI,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    Security,
+    WebSocket,
+    WebSocketDisconnect,
+)
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.security import APIKeyHeader
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+from sqlalchemy.exc import OperationalError
 
 import os
 from dotenv import load_dotenv
 
 from todo.domain.task import TaskStatus
-from todo.application.use_cases import (
+from todo.application.ports import AsyncTaskRepository, EventPublisher, Notifier, TaskEventType
+from todo.application.async_use_cases import (
     create_task,
     delete_task,
     update_task,
     get_task,
+    get_task_fields,
     list_tasks,
+    list_task_fields,
+    export_tasks,
+    count_tasks_by_status,
+    compact_changes,
+    get_data_version,
+    list_changes,
+    update_overdue_tasks,
+    search_tasks,
     change_task_status,
+    create_tasks,
+    update_tasks,
+    delete_tasks,
+)
+from todo.adapters.persistence.sqlite_repository import get_data_dir
+from todo.adapters.persistence.sqlite_async_repository import AsyncSQLiteTaskRepository
+from todo.adapters.notifications.notif import BufferedNotifier
+from todo.adapters.api.cache import ResponseCache, etag_response
+from todo.adapters.api.events import SSE_RESET, WS_RESET, EventBroker, format_sse, format_ws
+from todo.adapters.api.serialization import (
+    dump_batch,
+    dump_changes,
+    dump_event,
+    dump_task,
+    dump_task_fields,
+    dump_tasks,
+    dump_tasks_fields,
+    json_response,
 )
-from todo.adapters.persistence.sqlite_repository import SQLiteTaskRepository, get_data_dir
-from todo.adapters.notifications.notif import Notif
 
-app = FastAPI(title="TUI-tasker API", version="1.0.0")
-repository = SQLiteTaskRepository()
-notifier = Notif(str(get_data_dir() / "notifications.txt"))
+logger = logging.getLogger(__name__)
+
+# =========================
+# Dépendances (créées au premier appel, remplaçables via app.dependency_overrides)
+# =========================
+
+@lru_cache
+def get_repository() -> AsyncTaskRepository:
+    return AsyncSQLiteTaskRepository()
+
+@lru_cache
+def get_notifier() -> BufferedNotifier:
+    return BufferedNotifier(str(get_data_dir() / "notifications.txt"))
+
+@lru_cache
+def get_response_cache() -> ResponseCache:
+    return ResponseCache()
+
+@lru_cache
+def get_event_broker() -> EventBroker:
+    return EventBroker(dump_event)
+
+# Compactage du journal de synchronisation : suppressions gardées
+# CHANGES_RETENTION_DAYS jours (30 par défaut), vérifié toutes les heures
+CHANGES_COMPACT_INTERVAL = 3600.0
+
+async def compact_changes_periodically(app: FastAPI) -> None:
+    retention = timedelta(days=float(os.getenv("CHANGES_RETENTION_DAYS", "30")))
+    # Même repository que les routes, overrides compris
+    repository = app.dependency_overrides.get(get_repository, get_repository)()
+    while True:
+        try:
+            await compact_changes(repository, retention)
+        except OperationalError:
+            # Base occupée ou indisponible : nouvel essai au tour suivant
+            logger.warning("Changes compaction failed, retrying in %ss", CHANGES_COMPACT_INTERVAL, exc_info=True)
+        except Exception:
+            # Erreur de schéma / SQL : réessayer ne changerait rien, on s'arrête de façon visible
+            logger.exception("Changes compaction failed, stopping periodic compaction")
+            return
+        await asyncio.sleep(CHANGES_COMPACT_INTERVAL)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    compaction = asyncio.create_task(compact_changes_periodically(app))
+    yield
+    compaction.cancel()
+    with suppress(asyncio.CancelledError):
+        await compaction
+    if get_event_broker.cache_info().currsize:
+        get_event_broker().close()
+    if get_notifier.cache_info().currsize:
+        get_notifier().close()
+    if get_repository.cache_info().currsize:
+        await get_repository().close()
+
+app = FastAPI(title="TUI-tasker API", version="1.0.0", lifespan=lifespan)
 
 # =========================
 # Verif API key
@@ -40,6 +139,17 @@ async def verify_api_key(api_key: str = Security(api_key_header)):
         )
     return api_key
 
+# =========================
+# Compression des réponses
+# =========================
+# GZip au-delà de GZIP_MINIMUM_SIZE octets (les flux SSE ne sont pas compressés)
+
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=int(os.getenv("GZIP_MINIMUM_SIZE", "1024")),
+    compresslevel=int(os.getenv("GZIP_LEVEL", "6")),
+)
+
 # =========================
 # Vérif Pydantic
 # =========================
@@ -62,14 +172,83 @@ class TaskOut(BaseModel):
     status: TaskStatus
     due_date: Optional[date]
 
-def out(task) -> TaskOut:
-    return TaskOut(
-        id=task.id,
-        title=task.title,
-        description=task.description,
-        status=task.status,
-        due_date=task.due_date,
-    )
+class TaskStats(BaseModel):
+    total: int
+    in_progress: int
+    done: int
+    overdue: int
+
+class TaskChangeOut(BaseModel):
+    seq: int
+    task_id: int
+    op: TaskEventType
+    changed_at: datetime
+    task: Optional[TaskOut]
+
+class TaskChangesOut(BaseModel):
+    changes: List[TaskChangeOut]
+    cursor: int
+    has_more: bool
+
+# Taille maximale d'un lot : les ids partent dans un seul IN (...), qui doit rester
+# sous la limite de paramètres de SQLite (999 avant la 3.32)
+BATCH_MAX_ITEMS = 500
+
+class TaskBatchUpdate(TaskUpdate):
+    id: int
+
+class TaskBatchDelete(BaseModel):
+    ids: List[int] = Field(..., max_length=BATCH_MAX_ITEMS)
+
+class BatchError(BaseModel):
+    index: int
+    detail: str
+
+class TaskBatchOut(BaseModel):
+    items: List[TaskOut]
+    errors: List[BatchError]
+
+class TaskBatchDeleteOut(BaseModel):
+    deleted: List[int]
+    errors: List[BatchError]
+
+TASK_FIELDS = tuple(TaskOut.model_fields)
+
+def task_fields(
+    fields: Optional[str] = Query(
+        None,
+        description=f"Comma-separated fields to return, among: {', '.join(TASK_FIELDS)} (id is always returned)",
+    ),
+) -> Optional[Tuple[str, ...]]:
+    """Projection ?fields= : champs demandés dans l'ordre de TaskOut, id compris."""
+    if fields is None:
+        return None
+    requested = {name.strip() for name in fields.split(",") if name.strip()}
+    unknown = requested.difference(TASK_FIELDS)
+    if unknown:
+        raise HTTPException(
+            status_code=422,
+            detail=f"Unknown fields: {', '.join(sorted(unknown))}. Expected: {', '.join(TASK_FIELDS)}",
+        )
+    return tuple(name for name in TASK_FIELDS if name == "id" or name in requested)
+
+def validate_batch(model, payload: List[Dict[str, Any]]):
+    """Valide chaque élément du lot séparément : (index, modèle) valides + erreurs par index."""
+    valid = []
+    errors = []
+    for index, item in enumerate(payload):
+        try:
+            valid.append((index, model.model_validate(item)))
+        except ValidationError as e:
+            errors.append(BatchError(index=index, detail=e.errors()[0]["msg"]))
+    return valid, errors
+
+def batch_errors(valid, errors: Dict[int, str]) -> List[BatchError]:
+    """Ramène les erreurs du use case (index dans le sous-lot valide) à l'index d'origine."""
+    return [BatchError(index=valid[i][0], detail=detail) for i, detail in errors.items()]
+
+def sorted_errors(errors: List[BatchError]) -> List[Dict[str, Any]]:
+    return [error.model_dump() for error in sorted(errors, key=lambda e: e.index)]
 
 
 # =========================
@@ -77,44 +256,239 @@ def out(task) -> TaskOut:
 # =========================
 
 @app.post("/tasks", response_model=TaskOut, status_code=201, dependencies=[Security(verify_api_key)])
-def api_create_task(payload: TaskCreate):
-    task = create_task(
+async def api_create_task(
+    payload: TaskCreate,
+    repository: AsyncTaskRepository = Depends(get_repository),
+    notifier: Notifier = Depends(get_notifier),
+    publisher: EventPublisher = Depends(get_event_broker),
+):
+    task = await create_task(
         repository=repository,
         notifier=notifier,
         title=payload.title,
         description=payload.description,
         due_date=payload.due_date,
+        publisher=publisher,
     )
-    return out(task)
+    return json_response(dump_task(task), status_code=201)
 
 
+@app.get("/tasks/export", response_class=StreamingResponse, dependencies=[Security(verify_api_key)])
+async def api_export_tasks(
+    status: Optional[TaskStatus] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+    repository: AsyncTaskRepository = Depends(get_repository),
+):
+    tasks = await export_tasks(repository, status=status, due_from=due_from, due_to=due_to)
+    # Une tâche JSON par ligne, produite au fil du curseur
+    lines = (dump_task(t) + b"\n" async for t in tasks)
+    return StreamingResponse(lines, media_type="application/x-ndjson")
+
+
+@app.get("/tasks/stats", response_model=TaskStats, dependencies=[Security(verify_api_key)])
+async def api_task_stats(repository: AsyncTaskRepository = Depends(get_repository)):
+    # Un seul GROUP BY côté base, retards compris
+    counts = await count_tasks_by_status(repository)
+    return TaskStats(
+        total=sum(counts.values()),
+        in_progress=counts[TaskStatus.IN_PROGRESS],
+        done=counts[TaskStatus.DONE],
+        overdue=counts[TaskStatus.OVERDUE],
+    )
+
+
+@app.get("/tasks/search", response_model=List[TaskOut], dependencies=[Security(verify_api_key)])
+async def api_search_tasks(
+    q: str = Query(..., min_length=1),
+    limit: int = Query(50, ge=1, le=1000),
+    repository: AsyncTaskRepository = Depends(get_repository),
+):
+    # Index FTS5, tâches classées par pertinence (bm25)
+    tasks = await search_tasks(repository, q, limit)
+    return json_response(dump_tasks(tasks))
+
+
+# Synchronisation incrémentale depuis le journal task_changes : le client
+# renvoie `cursor` comme prochain `since`, et repart de since=0 sur un 410.
+@app.get("/tasks/changes", response_model=TaskChangesOut, dependencies=[Security(verify_api_key)])
+async def api_task_changes(
+    since: int = Query(0, ge=0),
+    limit: int = Query(1000, ge=1, le=5000),
+    repository: AsyncTaskRepository = Depends(get_repository),
+):
+    changes = await list_changes(repository, since, limit)
+    if changes is None:
+        raise HTTPException(
+            status_code=410,
+            detail="Changes since this cursor have been compacted, resync from since=0",
+        )
+
+    cursor = changes[-1].seq if changes else since
+    return json_response(dump_changes(changes, cursor, has_more=len(changes) == limit))
+
+
+# Flux des changements : create / update / status_changed / delete émis par
+# les use cases. Un client qui se reconnecte envoie le dernier id reçu
+# (en-tête Last-Event-ID ou ?last_event_id=) et ne reçoit que ce qu'il a manqué.
+SSE_KEEPALIVE = 15.0
+
+@app.get("/tasks/events", response_class=StreamingResponse, dependencies=[Security(verify_api_key)])
+async def api_task_events(
+    last_event_id: Optional[str] = Header(None),
+    resume: Optional[str] = Query(None, alias="last_event_id"),
+    broker: EventBroker = Depends(get_event_broker),
+):
+    subscription = broker.subscribe(last_event_id or resume)
+
+    async def stream():
+        try:
+            if subscription.reset:
+                yield SSE_RESET
+            for event in subscription.missed:
+                yield format_sse(event)
+            while True:
+                try:
+                    event = await asyncio.wait_for(subscription.queue.get(), SSE_KEEPALIVE)
+                except asyncio.TimeoutError:
+                    # Commentaire SSE : garde la connexion ouverte derrière les proxys
+                    yield ": keepalive\n\n"
+                    continue
+                if event is None:
+                    break
+                yield format_sse(event)
+        finally:
+            broker.unsubscribe(subscription)
+
+    return StreamingResponse(
+        stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@app.websocket("/tasks/events/ws")
+async def ws_task_events(
+    websocket: WebSocket,
+    last_event_id: Optional[str] = None,
+    broker: EventBroker = Depends(get_event_broker),
+):
+    # Même clé que les routes HTTP : en-tête X-API-Key ou ?api_key=
+    api_key = websocket.headers.get("x-api-key") or websocket.query_params.get("api_key")
+    if api_key is None or api_key != API_KEY:
+        await websocket.close(code=1008)
+        return
+
+    await websocket.accept()
+    subscription = broker.subscribe(last_event_id)
+    try:
+        if subscription.reset:
+            await websocket.send_text(WS_RESET)
+        for event in subscription.missed:
+            await websocket.send_text(format_ws(event))
+        while (event := await subscription.queue.get()) is not None:
+            await websocket.send_text(format_ws(event))
+        await websocket.close()
+    except WebSocketDisconnect:
+        pass
+    finally:
+        broker.unsubscribe(subscription)
+
+
+# Les deux GET suivants passent par le cache : la clé contient la version des
+# données (lue avant les données) et le jour, dont dépend le statut OVERDUE.
+# Un poll sans changement coûte une lecture de version, et un 304 si le
+# client envoie l'ETag reçu.
+
 @app.get("/tasks/{id}", response_model=TaskOut, dependencies=[Security(verify_api_key)])
-def api_get_task(id: int):
-    task = get_task(repository, id)
-    if task is None:
-        raise HTTPException(status_code=404, detail="Task not found")
-    return out(task)
+async def api_get_task(
+    id: int,
+    request: Request,
+    fields: Optional[Tuple[str, ...]] = Depends(task_fields),
+    repository: AsyncTaskRepository = Depends(get_repository),
+    cache: ResponseCache = Depends(get_response_cache),
+):
+    key = ("task", id, fields, await get_data_version(repository), date.today())
+    entry = cache.get(key)
+    if entry is None:
+        if fields is None:
+            task = await get_task(repository, id)
+            body = dump_task(task) if task is not None else None
+        else:
+            # Projection : seules les colonnes demandées sont lues en base
+            values = await get_task_fields(repository, id, fields)
+            body = dump_task_fields(values, fields) if values is not None else None
+        if body is None:
+            raise HTTPException(status_code=404, detail="Task not found")
+        entry = cache.put(key, body)
+    return etag_response(request, entry)
 
 @app.get("/tasks", response_model=List[TaskOut], dependencies=[Security(verify_api_key)])
-def api_list_tasks():
-    tasks = list_tasks(repository)
-    return [out(t) for t in tasks]
+async def api_list_tasks(
+    request: Request,
+    status: Optional[TaskStatus] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+    limit: Optional[int] = Query(None, ge=1, le=1000),
+    after_id: Optional[int] = Query(None, ge=0),
+    fields: Optional[Tuple[str, ...]] = Depends(task_fields),
+    repository: AsyncTaskRepository = Depends(get_repository),
+    cache: ResponseCache = Depends(get_response_cache),
+):
+    def list_key(version: int):
+        return ("list", status, due_from, due_to, limit, after_id, fields, version, date.today())
+
+    entry = cache.get(list_key(await get_data_version(repository)))
+    if entry is None:
+        # Le balayage des retards peut changer la version : on la relit après lui,
+        # avant la lecture, pour ranger le corps sous la version qu'il reflète
+        await update_overdue_tasks(repository)
+        key = list_key(await get_data_version(repository))
+        # On lit un élément de plus pour savoir s'il existe une page suivante
+        query = dict(
+            status=status,
+            due_from=due_from,
+            due_to=due_to,
+            limit=limit + 1 if limit is not None else None,
+            after_id=after_id,
+            sweep=False,
+        )
+        if fields is None:
+            tasks = await list_tasks(repository, **query)
+        else:
+            # Projection : seules les colonnes demandées sont lues en base
+            tasks = await list_task_fields(repository, fields, **query)
+        headers = {}
+        if limit is not None and len(tasks) > limit:
+            tasks = tasks[:limit]
+            last = tasks[-1]
+            headers["X-Next-Cursor"] = str(last.id if fields is None else last["id"])
+        body = dump_tasks(tasks) if fields is None else dump_tasks_fields(tasks, fields)
+        entry = cache.put(key, body, headers)
+    return etag_response(request, entry)
 
 @app.patch("/tasks/{id}", response_model=TaskOut, dependencies=[Security(verify_api_key)])
-def api_update_task(id: int, payload: TaskUpdate):
+async def api_update_task(
+    id: int,
+    payload: TaskUpdate,
+    repository: AsyncTaskRepository = Depends(get_repository),
+    notifier: Notifier = Depends(get_notifier),
+    publisher: EventPublisher = Depends(get_event_broker),
+):
     # Si le statut est fourni : on utilise change_task_status
     if payload.status is not None:
-        task = change_task_status(
+        task = await change_task_status(
             repository=repository,
             notifier=notifier,
             task_id=id,
             new_status=payload.status,
+            publisher=publisher,
         )
         if task is None:
             raise HTTPException(status_code=404, detail="Task not found")
         
         # On update les autres champs si besoin
-        updated = update_task(
+        updated = await update_task(
             repository=repository,
             notifier=notifier,
             task_id=id,
@@ -122,14 +496,15 @@ def api_update_task(id: int, payload: TaskUpdate):
             description=payload.description,
             status=None,
             due_date=payload.due_date,
+            publisher=publisher,
         )
         if updated is None:
             raise HTTPException(status_code=404, detail="Task not found")
         
-        return out(updated)
+        return json_response(dump_task(updated))
     else:
         # Sinon simple update
-        updated = update_task(
+        updated = await update_task(
             repository=repository,
             notifier=notifier,
             task_id=id,
@@ -137,16 +512,75 @@ def api_update_task(id: int, payload: TaskUpdate):
             description=payload.description,
             status=None,
             due_date=payload.due_date,
+            publisher=publisher,
         )
         if updated is None:
             raise HTTPException(status_code=404, detail="Task not found")
         
-        return out(updated)
+        return json_response(dump_task(updated))
 
 
 @app.delete("/tasks/{id}", status_code=204, dependencies=[Security(verify_api_key)])
-def api_delete_task(id: int):
-    ok = delete_task(repository, notifier, id)
+async def api_delete_task(
+    id: int,
+    repository: AsyncTaskRepository = Depends(get_repository),
+    notifier: Notifier = Depends(get_notifier),
+    publisher: EventPublisher = Depends(get_event_broker),
+):
+    ok = await delete_task(repository, notifier, id, publisher=publisher)
     if not ok:
         raise HTTPException(status_code=404, detail="Task not found")
     return None
+
+
+# =========================
+# Endpoints par lot
+# =========================
+
+@app.post("/tasks:batch", response_model=TaskBatchOut, dependencies=[Security(verify_api_key)])
+async def api_create_tasks(
+    payload: List[Dict[str, Any]] = Body(..., max_length=BATCH_MAX_ITEMS),
+    repository: AsyncTaskRepository = Depends(get_repository),
+    notifier: Notifier = Depends(get_notifier),
+    publisher: EventPublisher = Depends(get_event_broker),
+):
+    valid, errors = validate_batch(TaskCreate, payload)
+    created, failed = await create_tasks(
+        repository=repository,
+        notifier=notifier,
+        items=[item.model_dump() for _, item in valid],
+        publisher=publisher,
+    )
+    errors += batch_errors(valid, failed)
+    return json_response(dump_batch(created, sorted_errors(errors)))
+
+
+@app.patch("/tasks:batch", response_model=TaskBatchOut, dependencies=[Security(verify_api_key)])
+async def api_update_tasks(
+    payload: List[Dict[str, Any]] = Body(..., max_length=BATCH_MAX_ITEMS),
+    repository: AsyncTaskRepository = Depends(get_repository),
+    notifier: Notifier = Depends(get_notifier),
+    publisher: EventPublisher = Depends(get_event_broker),
+):
+    valid, errors = validate_batch(TaskBatchUpdate, payload)
+    # Champs absents de l'élément = inchangés (due_date: null l'efface explicitement)
+    updated, failed = await update_tasks(
+        repository=repository,
+        notifier=notifier,
+        items=[item.model_dump(exclude_unset=True) for _, item in valid],
+        publisher=publisher,
+    )
+    errors += batch_errors(valid, failed)
+    return json_response(dump_batch(updated, sorted_errors(errors)))
+
+
+@app.delete("/tasks:batch", response_model=TaskBatchDeleteOut, dependencies=[Security(verify_api_key)])
+async def api_delete_tasks(
+    payload: TaskBatchDelete,
+    repository: AsyncTaskRepository = Depends(get_repository),
+    notifier: Notifier = Depends(get_notifier),
+    publisher: EventPublisher = Depends(get_event_broker),
+):
+    deleted, failed = await delete_tasks(repository, notifier, payload.ids, publisher=publisher)
+    errors = [BatchError(index=index, detail=detail) for index, detail in failed.items()]
+    return TaskBatchDeleteOut(deleted=deleted, errors=errors)
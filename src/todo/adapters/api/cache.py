@@ -0,0 +1,74 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from hashlib import blake2b
+from typing import Dict, Hashable, Optional
+
+from fastapi import Request, Response
+
+
+# =========================
+# Cache des réponses sérialisées
+# =========================
+
+@dataclass(frozen=True)
+class CachedResponse:
+    body: bytes
+    etag: str
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+def make_etag(body: bytes) -> str:
+    # ETag faible : le même tag vaut pour le corps brut et sa version compressée (GZip)
+    return 'W/"' + blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+class ResponseCache:
+    """
+    Corps JSON déjà sérialisés, par clé (filtres, version des données, jour).
+    La version fait partie de la clé : aucune invalidation à gérer, les
+    entrées périmées sortent simplement par l'éviction LRU.
+    """
+
+    def __init__(self, maxsize: int = 256, max_body_bytes: int = 8 * 1024 * 1024):
+        self.maxsize = maxsize
+        # Un export complet de la table ne doit pas occuper le cache
+        self.max_body_bytes = max_body_bytes
+        self._entries: "OrderedDict[Hashable, CachedResponse]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable) -> Optional[CachedResponse]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def put(self, key: Hashable, body: bytes, headers: Optional[Dict[str, str]] = None) -> CachedResponse:
+        entry = CachedResponse(body=body, etag=make_etag(body), headers=headers or {})
+        if len(body) <= self.max_body_bytes:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def etag_response(request: Request, entry: CachedResponse) -> Response:
+    """Réponse 200 avec ETag, ou 304 vide si le client a déjà cette version."""
+    headers = {"ETag": entry.etag, **entry.headers}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None and _etag_matches(if_none_match, entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    if if_none_match.strip() == "*":
+        return True
+    # Comparaison faible (RFC 9110) : W/"x" et "x" désignent la même version
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag.removeprefix("W/") in candidates
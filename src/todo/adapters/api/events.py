@@ -0,0 +1,120 @@
+import asyncio
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from todo.application.ports import EventPublisher, TaskEventType
+from todo.domain.task import Task
+
+
+# =========================
+# Diffusion des changements (SSE / WebSocket)
+# =========================
+
+@dataclass(frozen=True)
+class Event:
+    seq: int
+    id: str    # Jeton de reprise envoyé au client : "<epoch>-<seq>"
+    type: str
+    data: str  # JSON déjà sérialisé, partagé par tous les abonnés
+
+
+@dataclass(eq=False)
+class Subscription:
+    queue: "asyncio.Queue[Optional[Event]]"
+    missed: List[Event] = field(default_factory=list)
+    # Le jeton ne peut pas être rejoué (autre démarrage, tampon dépassé) :
+    # le client doit recharger l'état complet
+    reset: bool = False
+
+
+class EventBroker(EventPublisher):
+    """
+    Diffusion en mémoire : tampon circulaire des derniers événements pour la
+    reprise (Last-Event-ID), une file asyncio par abonné.
+    À appeler depuis la boucle asyncio de l'API (use cases asynchrones).
+    """
+
+    def __init__(
+        self,
+        serialize: Callable[[TaskEventType, int, Optional[Task]], str],
+        buffer_size: int = 1000,
+        queue_size: int = 1000,
+    ):
+        self._serialize = serialize
+        self._buffer: "deque[Event]" = deque(maxlen=buffer_size)
+        self._queue_size = queue_size
+        self._subscriptions: set[Subscription] = set()
+        self._seq = 0
+        # Identifie ce démarrage : les numéros repartent de 1 au redémarrage
+        self.epoch = format(time.time_ns(), "x")
+
+    def publish(self, event_type: TaskEventType, task_id: int, task: Optional[Task] = None) -> None:
+        self._seq += 1
+        event = Event(
+            seq=self._seq,
+            id=f"{self.epoch}-{self._seq}",
+            type=event_type.value,
+            data=self._serialize(event_type, task_id, task),
+        )
+        self._buffer.append(event)
+
+        for subscription in list(self._subscriptions):
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                # Abonné trop lent : on le coupe, il reprendra depuis son dernier id
+                self._disconnect(subscription)
+
+    def subscribe(self, last_event_id: Optional[str] = None) -> Subscription:
+        subscription = Subscription(queue=asyncio.Queue(self._queue_size))
+        missed = self._replay(last_event_id)
+        if missed is None:
+            subscription.reset = True
+        else:
+            subscription.missed = missed
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+
+    def close(self) -> None:
+        """Termine tous les flux ouverts (arrêt de l'API)."""
+        for subscription in list(self._subscriptions):
+            self._disconnect(subscription)
+
+    def _disconnect(self, subscription: Subscription) -> None:
+        self._subscriptions.discard(subscription)
+        queue = subscription.queue
+        while not queue.empty():
+            queue.get_nowait()
+        queue.put_nowait(None)
+
+    def _replay(self, last_event_id: Optional[str]) -> Optional[List[Event]]:
+        """Événements postérieurs au jeton, ou None s'ils ne sont plus tous disponibles."""
+        if not last_event_id:
+            return []
+
+        epoch, _, seq = last_event_id.partition("-")
+        if epoch != self.epoch or not seq.isdigit():
+            return None
+
+        oldest = self._buffer[0].seq if self._buffer else self._seq + 1
+        if int(seq) < oldest - 1:
+            return None
+        return [event for event in self._buffer if event.seq > int(seq)]
+
+
+def format_sse(event: Event) -> str:
+    return f"id: {event.id}\nevent: {event.type}\ndata: {event.data}\n\n"
+
+
+def format_ws(event: Event) -> str:
+    return f'{{"id":"{event.id}","type":"{event.type}","data":{event.data}}}'
+
+
+# Envoyé à la place de l'historique quand le jeton de reprise n'est plus valable
+SSE_RESET = "event: reset\ndata: {}\n\n"
+WS_RESET = '{"type":"reset"}'
@@ -0,0 +1,144 @@
+from datetime import date, datetime
+from typing import Iterable, List, Optional, Sequence
+
+from fastapi import Response
+from pydantic import TypeAdapter
+from typing_extensions import TypedDict
+
+from todo.application.ports import TaskChange, TaskEventType, TaskFields
+from todo.domain.task import Task, TaskStatus
+
+
+# =========================
+# Sérialisation JSON directe
+# =========================
+# Les Task du domaine passent en dicts typés, écrits en bytes par pydantic-core :
+# ni modèle TaskOut construit, ni revalidation par response_model (qui reste
+# déclaré sur les routes pour la documentation OpenAPI).
+
+class TaskBody(TypedDict):
+    id: int
+    title: str
+    description: Optional[str]
+    status: TaskStatus
+    due_date: Optional[date]
+
+
+class TaskFieldsBody(TypedDict, total=False):
+    """Projection ?fields= : l'id et les seuls champs demandés."""
+    id: int
+    title: str
+    description: Optional[str]
+    status: TaskStatus
+    due_date: Optional[date]
+
+
+class BatchErrorBody(TypedDict):
+    index: int
+    detail: str
+
+
+class TaskBatchBody(TypedDict):
+    items: List[TaskBody]
+    errors: List[BatchErrorBody]
+
+
+class TaskChangeBody(TypedDict):
+    seq: int
+    task_id: int
+    op: TaskEventType
+    changed_at: datetime
+    task: Optional[TaskBody]
+
+
+class TaskChangesBody(TypedDict):
+    changes: List[TaskChangeBody]
+    cursor: int
+    has_more: bool
+
+
+class TaskEventBody(TypedDict):
+    type: TaskEventType
+    task_id: int
+    task: Optional[TaskBody]
+
+
+task_json = TypeAdapter(TaskBody)
+task_list_json = TypeAdapter(List[TaskBody])
+task_fields_json = TypeAdapter(TaskFieldsBody)
+task_fields_list_json = TypeAdapter(List[TaskFieldsBody])
+task_batch_json = TypeAdapter(TaskBatchBody)
+task_changes_json = TypeAdapter(TaskChangesBody)
+task_event_json = TypeAdapter(TaskEventBody)
+
+
+def task_body(task: Task) -> TaskBody:
+    return {
+        "id": task.id,
+        "title": task.title,
+        "description": task.description,
+        "status": task.status,
+        "due_date": task.due_date,
+    }
+
+
+def _optional_body(task: Optional[Task]) -> Optional[TaskBody]:
+    return task_body(task) if task is not None else None
+
+
+def fields_body(values: TaskFields, fields: Sequence[str]) -> TaskFieldsBody:
+    """Ligne projetée, réduite aux `fields` demandés (sans les colonnes lues en plus)."""
+    return {name: values[name] for name in fields}
+
+
+def dump_task(task: Task) -> bytes:
+    return task_json.dump_json(task_body(task))
+
+
+def dump_tasks(tasks: Iterable[Task]) -> bytes:
+    return task_list_json.dump_json([task_body(task) for task in tasks])
+
+
+def dump_task_fields(values: TaskFields, fields: Sequence[str]) -> bytes:
+    return task_fields_json.dump_json(fields_body(values, fields))
+
+
+def dump_tasks_fields(rows: Iterable[TaskFields], fields: Sequence[str]) -> bytes:
+    return task_fields_list_json.dump_json([fields_body(values, fields) for values in rows])
+
+
+def dump_batch(tasks: Iterable[Task], errors: Iterable[BatchErrorBody]) -> bytes:
+    return task_batch_json.dump_json({
+        "items": [task_body(task) for task in tasks],
+        "errors": list(errors),
+    })
+
+
+def dump_changes(changes: List[TaskChange], cursor: int, has_more: bool) -> bytes:
+    return task_changes_json.dump_json({
+        "changes": [
+            {
+                "seq": change.seq,
+                "task_id": change.task_id,
+                "op": change.op,
+                "changed_at": change.changed_at,
+                "task": _optional_body(change.task),
+            }
+            for change in changes
+        ],
+        "cursor": cursor,
+        "has_more": has_more,
+    })
+
+
+def dump_event(event_type: TaskEventType, task_id: int, task: Optional[Task]) -> str:
+    """Données d'un événement du flux (texte : insérées telles quelles dans SSE / WebSocket)."""
+    return task_event_json.dump_json({
+        "type": event_type,
+        "task_id": task_id,
+        "task": _optional_body(task),
+    }).decode()
+
+
+def json_response(body: bytes, status_code: int = 200) -> Response:
+    return Response(content=body, status_code=status_code, media_type="application/json")
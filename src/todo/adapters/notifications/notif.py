@@ -1,14 +1,194 @@
-from datetime import datetime
+import atexit
+import gzip
+import os
+import shutil
+import threading
+from datetime import date, datetime
+from typing import Callable
 
 from todo.application.ports import Notifier
 
 
+def format_lines(messages: list[str]) -> list[str]:
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    return [f"[{timestamp}] {message}\n" for message in messages]
+
+
+def tail_lines(path: str, count: int, block_size: int = 8192) -> tuple[list[str], int]:
+    """
+    Retourne les `count` dernières lignes du fichier, lues à rebours par blocs depuis la fin,
+    et la taille du fichier (offset à partir duquel lire la suite).
+    """
+    with open(path, "rb") as f:
+        end = f.seek(0, os.SEEK_END)
+        pos = end
+        data = b""
+        # Une ligne de plus que demandé : la première peut être coupée
+        while pos > 0 and data.count(b"\n") <= count:
+            step = min(block_size, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+
+    lines = data.decode("utf-8", errors="replace").splitlines()
+    return lines[-count:] if count else [], end
+
+
 class Notif(Notifier):
-    def __init__(self, path: str):
+    """
+    Journal des notifications dans un fichier texte, avec rotation :
+    le fichier passe en .1 (.gz si compress) quand il dépasserait max_bytes,
+    ou au premier message d'un nouveau jour si daily. Seuls backup_count segments sont gardés.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 5 * 1024 * 1024,
+        backup_count: int = 5,
+        daily: bool = False,
+        compress: bool = True,
+    ):
         self.path = path
+        self.max_bytes = max_bytes
+        self.backup_count = backup_count
+        self.daily = daily
+        self.compress = compress
+        self._subscribers: list[Callable[[list[str]], None]] = []
 
     def notify(self, message: str) -> None:
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.notify_many([message])
+
+    def notify_many(self, messages: list[str]) -> None:
+        self._write(format_lines(messages))
+
+    def _write(self, lines: list[str]) -> None:
+        data = "".join(lines)
+        if self._should_rotate(len(data.encode("utf-8"))):
+            self._rotate()
 
         with open(self.path, "a", encoding="utf-8") as f:
-            f.write(f"[{timestamp}] {message}\n")
+            f.write(data)
+        self._publish([line.rstrip("\n") for line in lines])
+
+    # ---------------- Pub/sub ----------------
+
+    def subscribe(self, callback: Callable[[list[str]], None]) -> Callable[[], None]:
+        """
+        Abonne `callback` aux lignes écrites (appelé après l'écriture, depuis le thread
+        qui écrit). Retourne la fonction de désabonnement.
+        """
+        self._subscribers = [*self._subscribers, callback]
+
+        def unsubscribe() -> None:
+            self._subscribers = [s for s in self._subscribers if s is not callback]
+        return unsubscribe
+
+    def _publish(self, lines: list[str]) -> None:
+        for callback in self._subscribers:
+            callback(lines)
+
+    # ---------------- Rotation ----------------
+
+    def _should_rotate(self, incoming: int) -> bool:
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+
+        if stat.st_size == 0:
+            return False
+        if self.max_bytes and stat.st_size + incoming > self.max_bytes:
+            return True
+        return self.daily and date.fromtimestamp(stat.st_mtime) != date.today()
+
+    def _segment(self, index: int) -> str:
+        return f"{self.path}.{index}" + (".gz" if self.compress else "")
+
+    def _rotate(self) -> None:
+        # Un autre processus (API / TUI) peut avoir déjà fait la rotation : on ignore
+        try:
+            if self.backup_count <= 0:
+                os.remove(self.path)
+                return
+
+            for index in range(self.backup_count - 1, 0, -1):
+                if os.path.exists(self._segment(index)):
+                    os.replace(self._segment(index), self._segment(index + 1))
+
+            rotated = f"{self.path}.1"
+            os.replace(self.path, rotated)
+        except FileNotFoundError:
+            return
+
+        if self.compress:
+            with open(rotated, "rb") as src, gzip.open(rotated + ".gz", "wb") as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(rotated)
+
+
+# =========================
+# Notifier bufferisé
+# =========================
+
+class BufferedNotifier(Notif):
+    """
+    Met les messages en file et les écrit depuis un thread de fond, une écriture par lot :
+    dès que max_batch messages sont en attente, ou flush_interval secondes après le premier.
+    Le thread dort tant qu'il n'y a rien à écrire ; close() (appelé aussi à la sortie
+    de l'interpréteur) écrit ce qui reste.
+    """
+
+    def __init__(self, path: str, max_batch: int = 100, flush_interval: float = 0.2, **rotation):
+        super().__init__(path, **rotation)
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self._buffer: list[str] = []
+        self._closed = False
+        self._cond = threading.Condition()
+        self._write_lock = threading.Lock()  # garde l'ordre entre thread de fond et flush()
+        self._thread = threading.Thread(target=self._run, name="notif-flush", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    def notify_many(self, messages: list[str]) -> None:
+        lines = format_lines(messages)
+        with self._cond:
+            if self._closed:
+                # Après close() : écriture directe plutôt que perdre le message
+                self._write(lines)
+                return
+            was_empty = not self._buffer
+            self._buffer.extend(lines)
+            if was_empty or len(self._buffer) >= self.max_batch:
+                self._cond.notify()
+
+    def flush(self) -> None:
+        """Écrit immédiatement les messages en attente."""
+        with self._write_lock:
+            with self._cond:
+                lines, self._buffer = self._buffer, []
+            if lines:
+                self._write(lines)
+
+    def close(self) -> None:
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+        atexit.unregister(self.close)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._buffer and not self._closed:
+                    self._cond.wait()
+                # Laisse le lot se remplir jusqu'à max_batch ou flush_interval
+                if not self._closed and len(self._buffer) < self.max_batch:
+                    self._cond.wait(self.flush_interval)
+                closed = self._closed
+            self.flush()
+            if closed:
+                return
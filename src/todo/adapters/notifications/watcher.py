@@ -0,0 +1,143 @@
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import threading
+from typing import Callable, Optional
+
+
+# =========================
+# inotify (Linux)
+# =========================
+
+IN_MODIFY = 0x00000002
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_NONBLOCK = 0o4000
+IN_CLOEXEC = 0o2000000
+
+# On surveille le dossier : le fichier peut être remplacé (rotation) ou créé après coup
+WATCH_MASK = IN_MODIFY | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+EVENT_HEADER = struct.Struct("iIII")  # wd, mask, cookie, len
+
+
+def _load_libc():
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    except OSError:
+        return None
+    return libc if hasattr(libc, "inotify_init1") else None
+
+
+def _event_names(buffer: bytes) -> list[str]:
+    names = []
+    offset = 0
+    while offset + EVENT_HEADER.size <= len(buffer):
+        _, _, _, length = EVENT_HEADER.unpack_from(buffer, offset)
+        offset += EVENT_HEADER.size
+        names.append(buffer[offset:offset + length].rstrip(b"\0").decode(errors="replace"))
+        offset += length
+    return names
+
+
+# =========================
+# Watcher
+# =========================
+
+class FileWatcher:
+    """
+    Appelle `callback` (depuis un thread de fond) quand le fichier change, y compris
+    quand il est écrit par un autre processus. Utilise inotify sous Linux : le thread
+    reste bloqué sans aucun réveil tant que rien ne change. Ailleurs, ou si inotify
+    n'est pas disponible, scrute la taille / date du fichier toutes les poll_interval secondes.
+    """
+
+    def __init__(self, path: str, callback: Callable[[], None], poll_interval: float = 1.0):
+        self.path = os.path.abspath(path)
+        self.callback = callback
+        self.poll_interval = poll_interval
+        self.mode: Optional[str] = None  # "inotify" ou "polling", une fois démarré
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._wake_r, self._wake_w = -1, -1
+
+    def start(self) -> None:
+        fd = self._open_inotify()
+        if fd is not None:
+            self.mode = "inotify"
+            self._wake_r, self._wake_w = os.pipe()
+            target, args = self._run_inotify, (fd,)
+        else:
+            self.mode = "polling"
+            # Signature initiale prise avant le démarrage du thread : pas d'écriture manquée
+            target, args = self._run_polling, (self._signature(),)
+
+        self._thread = threading.Thread(target=target, args=args, name="notif-watcher", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._wake_w >= 0:
+            os.write(self._wake_w, b"\0")
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+        for fd in (self._wake_r, self._wake_w):
+            if fd >= 0:
+                os.close(fd)
+        self._wake_r, self._wake_w = -1, -1
+
+    # ---------------- inotify ----------------
+
+    def _open_inotify(self) -> Optional[int]:
+        libc = _load_libc()
+        if libc is None:
+            return None
+
+        fd = libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            return None
+        directory = os.path.dirname(self.path).encode()
+        if libc.inotify_add_watch(fd, directory, WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+        return fd
+
+    def _run_inotify(self, fd: int) -> None:
+        name = os.path.basename(self.path)
+        try:
+            while not self._stop.is_set():
+                ready, _, _ = select.select([fd, self._wake_r], [], [])
+                if fd not in ready:
+                    continue
+                try:
+                    buffer = os.read(fd, 64 * 1024)
+                except BlockingIOError:
+                    continue
+                if name in _event_names(buffer):
+                    self.callback()
+        finally:
+            os.close(fd)
+
+    # ---------------- Polling ----------------
+
+    def _signature(self):
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    def _run_polling(self, last) -> None:
+        while not self._stop.wait(self.poll_interval):
+            current = self._signature()
+            if current != last:
+                last = current
+                self.callback()
@@ -0,0 +1,249 @@
+import asyncio
+import os
+from datetime import date, datetime
+from typing import AsyncIterator, Collection, Dict, List, Optional
+
+from sqlalchemy import insert, update
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from todo.domain.task import Task, TaskStatus
+from todo.application.ports import AsyncTaskRepository, TaskChange, TaskFields
+from todo.adapters.persistence.sqlite_repository import (
+    TaskTable,
+    changes_horizon_query,
+    changes_query,
+    compact_changes_query,
+    configure_sqlite,
+    count_by_status_query,
+    data_version_query,
+    delete_many_query,
+    fts_query,
+    get_one_query,
+    init_schema,
+    list_query,
+    overdue_update_query,
+    projection_columns,
+    raise_horizon_query,
+    resolve_database_url,
+    search_query,
+    task_values,
+    to_changes,
+    to_counts,
+    to_fields,
+    to_task,
+    update_one_query,
+)
+
+
+def to_async_url(database_url: str) -> str:
+    """sqlite:///... -> sqlite+aiosqlite:///..."""
+    return make_url(database_url).set(drivername="sqlite+aiosqlite").render_as_string(hide_password=False)
+
+
+# =========================
+# Repository SQLite asynchrone (aiosqlite)
+# =========================
+
+class AsyncSQLiteTaskRepository(AsyncTaskRepository):
+    """
+    Implémentation aiosqlite du port AsyncTaskRepository.
+    Mêmes table, requêtes et profil SQLite que SQLiteTaskRepository.
+    """
+
+    def __init__(self, database_url: Optional[str] = None):
+        self.database_url = database_url
+        self._engine: Optional[AsyncEngine] = None
+        self._sessionmaker: Optional[async_sessionmaker[AsyncSession]] = None
+        self._init_lock = asyncio.Lock()
+
+    async def _session(self) -> AsyncSession:
+        # L'engine (et le schéma) n'est créé qu'à la première requête
+        if self._sessionmaker is None:
+            async with self._init_lock:
+                if self._sessionmaker is None:
+                    engine = create_async_engine(to_async_url(resolve_database_url(self.database_url)))
+                    configure_sqlite(engine.sync_engine, os.getenv("SQLITE_PROFILE", "wal"))
+                    async with engine.begin() as conn:
+                        await conn.run_sync(init_schema)
+                    self._engine = engine
+                    # Pas d'expiration après commit : aucun lazy-load (I/O implicite) en async
+                    self._sessionmaker = async_sessionmaker(engine, expire_on_commit=False)
+        return self._sessionmaker()
+
+    async def close(self) -> None:
+        if self._engine is not None:
+            await self._engine.dispose()
+            self._engine = None
+            self._sessionmaker = None
+
+    async def add(self, task: Task) -> None:
+        async with await self._session() as session:
+            orm_task = TaskTable(**task_values(task))
+
+            session.add(orm_task)
+            await session.commit()
+            task.id = orm_task.id
+
+    async def delete(self, task_id: int) -> None:
+        async with await self._session() as session:
+            orm_task = await session.get(TaskTable, task_id)
+
+            if orm_task is None:
+                return
+
+            await session.delete(orm_task)
+            await session.commit()
+
+    async def get(self, task_id: int) -> Task | None:
+        async with await self._session() as session:
+            conn = await session.connection()
+            row = (await conn.execute(get_one_query(task_id))).first()
+            return to_task(row) if row is not None else None
+
+    async def get_fields(self, task_id: int, fields: Collection[str]) -> Optional[TaskFields]:
+        async with await self._session() as session:
+            conn = await session.connection()
+            row = (await conn.execute(get_one_query(task_id, projection_columns(fields)))).first()
+            return to_fields(row) if row is not None else None
+
+    async def update(self, task: Task) -> Task | None:
+        async with await self._session() as session:
+            conn = await session.connection()
+            row = (await conn.execute(update_one_query(task))).first()
+            await session.commit()
+            return to_task(row) if row is not None else None
+
+    async def list(
+        self,
+        status: Optional[TaskStatus] = None,
+        due_from: Optional[date] = None,
+        due_to: Optional[date] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+    ) -> List[Task]:
+        query = list_query(status, due_from, due_to, limit, after_id, before_id)
+
+        async with await self._session() as session:
+            conn = await session.connection()
+            rows = (await conn.execute(query)).all()
+        tasks = [to_task(row) for row in rows]
+        if before_id is not None:
+            tasks.reverse()
+        return tasks
+
+    async def list_fields(
+        self,
+        fields: Collection[str],
+        status: Optional[TaskStatus] = None,
+        due_from: Optional[date] = None,
+        due_to: Optional[date] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List[TaskFields]:
+        query = list_query(status, due_from, due_to, limit, after_id, columns=projection_columns(fields))
+
+        async with await self._session() as session:
+            conn = await session.connection()
+            rows = (await conn.execute(query)).all()
+        return [to_fields(row) for row in rows]
+
+    async def search(self, query: str, limit: int = 50) -> List[Task]:
+        match = fts_query(query)
+        if match is None:
+            return []
+
+        async with await self._session() as session:
+            conn = await session.connection()
+            rows = (await conn.execute(search_query(match, limit))).all()
+        return [to_task(row) for row in rows]
+
+    async def data_version(self) -> int:
+        async with await self._session() as session:
+            conn = await session.connection()
+            return (await conn.execute(data_version_query())).scalar_one()
+
+    async def count_by_status(self, today: date) -> Dict[TaskStatus, int]:
+        async with await self._session() as session:
+            return to_counts(await session.execute(count_by_status_query(today)))
+
+    async def stream(
+        self,
+        status: Optional[TaskStatus] = None,
+        due_from: Optional[date] = None,
+        due_to: Optional[date] = None,
+        batch_size: int = 1000,
+    ) -> AsyncIterator[Task]:
+        query = list_query(status, due_from, due_to).execution_options(yield_per=batch_size)
+
+        async with await self._session() as session:
+            conn = await session.connection()
+            async for row in await conn.stream(query):
+                yield to_task(row)
+
+    async def get_many(self, task_ids: List[int]) -> List[Task]:
+        if not task_ids:
+            return []
+
+        async with await self._session() as session:
+            conn = await session.connection()
+            rows = (await conn.execute(list_query().where(TaskTable.id.in_(task_ids)))).all()
+        return [to_task(row) for row in rows]
+
+    async def add_many(self, tasks: List[Task]) -> None:
+        if not tasks:
+            return
+
+        rows = [task_values(task) for task in tasks]
+        async with await self._session() as session:
+            ids = (
+                await session.scalars(
+                    insert(TaskTable).returning(TaskTable.id, sort_by_parameter_order=True),
+                    rows,
+                )
+            ).all()
+            await session.commit()
+
+        for task, task_id in zip(tasks, ids):
+            task.id = task_id
+
+    async def update_many(self, tasks: List[Task]) -> None:
+        if not tasks:
+            return
+
+        rows = [{"id": task.id, **task_values(task)} for task in tasks]
+        async with await self._session() as session:
+            await session.execute(update(TaskTable), rows)
+            await session.commit()
+
+    async def delete_many(self, task_ids: List[int]) -> List[int]:
+        if not task_ids:
+            return []
+
+        async with await self._session() as session:
+            deleted_ids = list(await session.scalars(delete_many_query(task_ids)))
+            await session.commit()
+            return deleted_ids
+
+    async def mark_overdue_before(self, today: date) -> List[int]:
+        async with await self._session() as session:
+            overdue_ids = list(await session.scalars(overdue_update_query(today)))
+            await session.commit()
+            return overdue_ids
+
+    async def changes_since(self, since: int, limit: int = 1000) -> Optional[List[TaskChange]]:
+        async with await self._session() as session:
+            conn = await session.connection()
+            rows = (await conn.execute(changes_query(since, limit))).all()
+            horizon = (await conn.execute(changes_horizon_query())).scalar_one()
+        return to_changes(rows, since, horizon)
+
+    async def compact_changes(self, deleted_before: datetime) -> int:
+        async with await self._session() as session:
+            conn = await session.connection()
+            seqs = (await conn.execute(compact_changes_query(deleted_before))).scalars().all()
+            if seqs:
+                await conn.execute(raise_horizon_query(max(seqs)))
+            await session.commit()
+            return len(seqs)
@@ -4,12 +4,31 @@ from sqlalchemy import (
     Integer,
     String,
     Date,
+    DateTime,
+    Index,
+    delete,
+    insert,
+    select,
+    update,
+    event,
+    func,
+    case,
+    column,
+    literal_column,
+    table,
+    text,
 )
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
+from functools import lru_cache
 from pathlib import Path
+from dotenv import load_dotenv
+import os
+from datetime import date, datetime, timezone
+from typing import Collection, Dict, Iterator, List, Optional
 
 from todo.domain.task import Task, TaskStatus
-from todo.application.ports import TaskRepository
+from todo.application.ports import TaskChange, TaskEventType, TaskFields, TaskRepository
 
 
 # =========================
@@ -26,11 +45,68 @@ def get_data_dir() -> Path:
     data_dir.mkdir(parents=True, exist_ok=True)
     return data_dir
 
-DB_PATH = get_data_dir() / "todo.db"
-DATABASE_URL = f"sqlite:///{DB_PATH}"
+# =========================
+# Profils SQLite (PRAGMA par connexion)
+# =========================
+# "wal" : lectures concurrentes pendant les écritures (TUI + API sur le même fichier),
+# fsync seulement aux checkpoints. "default" : réglages SQLite d'origine.
+# Attention : journal_mode=WAL est persistant dans le fichier de base.
+
+SQLITE_PROFILES = {
+    "default": {},
+    "wal": {
+        "journal_mode": "WAL",
+        "synchronous": "NORMAL",
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64 * 1024,  # négatif = en Kio
+        "temp_store": "MEMORY",
+        "busy_timeout": 5000,  # ms
+    },
+}
+
+
+def configure_sqlite(engine, profile: str) -> None:
+    """Applique les PRAGMA du profil à chaque nouvelle connexion de l'engine."""
+    if profile not in SQLITE_PROFILES:
+        raise ValueError(
+            f"Unknown SQLite profile '{profile}', expected one of: {', '.join(SQLITE_PROFILES)}"
+        )
+    pragmas = SQLITE_PROFILES[profile]
+
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+
+# =========================
+# Engine (créé au premier usage)
+# =========================
+
+def get_engine(database_url: Optional[str] = None) -> Engine:
+    """
+    Retourne l'engine de l'URL, créé avec son profil et son schéma au premier appel.
+    Sans URL : DATABASE_URL (env / .env), sinon todo.db dans le dossier de données.
+    """
+    return _create_engine(resolve_database_url(database_url), os.getenv("SQLITE_PROFILE", "wal"))
+
+
+def resolve_database_url(database_url: Optional[str] = None) -> str:
+    load_dotenv()
+    if database_url is None:
+        database_url = os.getenv("DATABASE_URL") or f"sqlite:///{get_data_dir() / 'todo.db'}"
+    return database_url
+
+
+@lru_cache(maxsize=None)
+def _create_engine(database_url: str, profile: str) -> Engine:
+    engine = create_engine(database_url, echo=False)
+    configure_sqlite(engine, profile)
+    init_schema(engine)
+    return engine
 
-engine = create_engine(DATABASE_URL, echo=False)
-SessionLocal = sessionmaker(bind=engine)
 
 Base = declarative_base()
 
@@ -41,16 +117,392 @@ Base = declarative_base()
 
 class TaskTable(Base):
     __tablename__ = "tasks"
+    __table_args__ = (
+        Index("ix_tasks_status_due_date", "status", "due_date"),
+    )
 
     id = Column(Integer, primary_key=True, autoincrement=True)
     title = Column(String, nullable=False)
     description = Column(String, nullable=True)
-    status = Column(String, nullable=False)
-    due_date = Column(Date, nullable=True)
+    status = Column(String, nullable=False, index=True)
+    due_date = Column(Date, nullable=True, index=True)
 
 
-# Crée si pas existant
-Base.metadata.create_all(bind=engine)
+# Index plein texte (FTS5) sur titre + description, en "external content" :
+# il ne stocke que l'index, les triggers le tiennent à jour depuis `tasks`
+TASKS_FTS_DDL = [
+    """
+    CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+        title, description,
+        content='tasks', content_rowid='id',
+        tokenize='unicode61 remove_diacritics 2'
+    )
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+        INSERT INTO tasks_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS tasks_fts_update AFTER UPDATE OF title, description ON tasks BEGIN
+        INSERT INTO tasks_fts(tasks_fts, rowid, title, description)
+        VALUES ('delete', old.id, old.title, old.description);
+        INSERT INTO tasks_fts(rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+]
+
+tasks_fts = table("tasks_fts", column("rowid"), column("tasks_fts"))
+
+# Version des données : une seule ligne, incrémentée par trigger à chaque
+# insertion, modification ou suppression de tâche (quel que soit le processus)
+TASKS_REVISION_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS task_revision (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL
+    )
+    """,
+    "INSERT OR IGNORE INTO task_revision (id, version) VALUES (1, 0)",
+    """
+    CREATE TRIGGER IF NOT EXISTS task_revision_insert AFTER INSERT ON tasks BEGIN
+        UPDATE task_revision SET version = version + 1 WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_revision_update AFTER UPDATE ON tasks BEGIN
+        UPDATE task_revision SET version = version + 1 WHERE id = 1;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_revision_delete AFTER DELETE ON tasks BEGIN
+        UPDATE task_revision SET version = version + 1 WHERE id = 1;
+    END
+    """,
+]
+
+task_revision = table("task_revision", column("id"), column("version"))
+
+# Journal de synchronisation : une ligne par tâche, remplacée (nouveau numéro
+# AUTOINCREMENT, jamais réutilisé) à chaque changement, dans la transaction de
+# l'écriture. Les suppressions restent comme marqueurs jusqu'au compactage ;
+# task_changes_horizon garde le plus grand numéro de marqueur oublié.
+TASK_CHANGES_DDL = [
+    """
+    CREATE TABLE IF NOT EXISTS task_changes (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        task_id INTEGER NOT NULL UNIQUE,
+        op TEXT NOT NULL,
+        changed_at TEXT NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+    """,
+    """
+    CREATE INDEX IF NOT EXISTS ix_task_changes_deleted
+    ON task_changes (changed_at) WHERE op = 'deleted'
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS task_changes_horizon (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        seq INTEGER NOT NULL
+    )
+    """,
+    "INSERT OR IGNORE INTO task_changes_horizon (id, seq) VALUES (1, 0)",
+    """
+    CREATE TRIGGER IF NOT EXISTS task_changes_insert AFTER INSERT ON tasks BEGIN
+        INSERT OR REPLACE INTO task_changes (task_id, op) VALUES (new.id, 'created');
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_changes_update AFTER UPDATE ON tasks BEGIN
+        INSERT OR REPLACE INTO task_changes (task_id, op) VALUES (new.id, 'updated');
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS task_changes_delete AFTER DELETE ON tasks BEGIN
+        INSERT OR REPLACE INTO task_changes (task_id, op) VALUES (old.id, 'deleted');
+    END
+    """,
+]
+
+task_changes = table(
+    "task_changes",
+    column("seq"),
+    column("task_id"),
+    column("op"),
+    column("changed_at", DateTime),
+)
+task_changes_horizon = table("task_changes_horizon", column("id"), column("seq"))
+
+
+def init_schema(bind: Engine | Connection) -> None:
+    """Crée les tables, index et l'index plein texte manquants."""
+    Base.metadata.create_all(bind=bind)
+    # create_all ignore les index des tables déjà existantes
+    for index in TaskTable.__table__.indexes:
+        index.create(bind=bind, checkfirst=True)
+
+    if bind.dialect.name != "sqlite":
+        return
+    if isinstance(bind, Engine):
+        with bind.begin() as conn:
+            _init_sqlite(conn)
+    else:
+        _init_sqlite(bind)
+
+
+def _init_sqlite(conn: Connection) -> None:
+    _init_search(conn)
+    for statement in TASKS_REVISION_DDL:
+        conn.exec_driver_sql(statement)
+    _init_changes(conn)
+
+
+def _init_changes(conn: Connection) -> None:
+    exists = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'task_changes'")
+    ).first()
+    for statement in TASK_CHANGES_DDL:
+        conn.exec_driver_sql(statement)
+    if not exists:
+        # Base antérieure au journal : chaque tâche existante y entre comme créée
+        conn.exec_driver_sql(
+            "INSERT INTO task_changes (task_id, op) SELECT id, 'created' FROM tasks ORDER BY id"
+        )
+
+
+def _init_search(conn: Connection) -> None:
+    exists = conn.execute(
+        text("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks_fts'")
+    ).first()
+    for statement in TASKS_FTS_DDL:
+        conn.exec_driver_sql(statement)
+    if not exists:
+        # Base antérieure à la recherche : on indexe les tâches existantes
+        conn.exec_driver_sql("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+
+
+# =========================
+# Requêtes (partagées avec sqlite_async_repository)
+# =========================
+# Construites ici, exécutées par chaque adapter sur sa connexion (sync ou async)
+
+# Colonnes d'une Task : les lectures passent par des select() Core sur ces
+# colonnes et construisent la Task depuis le tuple, sans instance ORM
+TASK_COLUMNS = (
+    TaskTable.id,
+    TaskTable.title,
+    TaskTable.description,
+    TaskTable.status,
+    TaskTable.due_date,
+)
+
+
+def projection_columns(fields: Collection[str]) -> tuple:
+    """Projection : l'id et les champs demandés, dans l'ordre de TASK_COLUMNS."""
+    return tuple(col for col in TASK_COLUMNS if col.key == "id" or col.key in fields)
+
+
+def _filter_tasks(
+    query,
+    status: Optional[TaskStatus] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+):
+    """Applique les filtres communs (statut, plage d'échéance) à une requête."""
+    if status is not None:
+        query = query.where(TaskTable.status == TaskStatus(status).value)
+    if due_from is not None:
+        query = query.where(TaskTable.due_date >= due_from)
+    if due_to is not None:
+        query = query.where(TaskTable.due_date <= due_to)
+    return query
+
+
+def list_query(
+    status: Optional[TaskStatus] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
+    before_id: Optional[int] = None,
+    columns: tuple = TASK_COLUMNS,
+):
+    query = _filter_tasks(select(*columns), status, due_from, due_to)
+    if after_id is not None:
+        query = query.where(TaskTable.id > after_id)
+    if before_id is not None:
+        # Page précédente : les `limit` ids juste avant, remis dans l'ordre par l'appelant
+        query = query.where(TaskTable.id < before_id).order_by(TaskTable.id.desc())
+    else:
+        query = query.order_by(TaskTable.id)
+    if limit is not None:
+        query = query.limit(limit)
+    return query
+
+
+def fts_query(query: str) -> Optional[str]:
+    """
+    Traduit une saisie libre en requête FTS5 sûre : chaque mot devient un
+    préfixe entre guillemets (pas d'opérateurs, pas d'erreur de syntaxe).
+    """
+    words = query.split()
+    if not words:
+        return None
+    return " ".join('"' + word.replace('"', '""') + '"*' for word in words)
+
+
+def search_query(match: str, limit: int):
+    # bm25 : score d'autant plus petit que la tâche est pertinente
+    return (
+        select(*TASK_COLUMNS)
+        .join(tasks_fts, tasks_fts.c.rowid == TaskTable.id)
+        .where(tasks_fts.c.tasks_fts.op("MATCH")(match))
+        .order_by(func.bm25(literal_column("tasks_fts")))
+        .limit(limit)
+    )
+
+
+def data_version_query():
+    return select(task_revision.c.version).where(task_revision.c.id == 1)
+
+
+def changes_query(since: int, limit: int):
+    # Jointure externe : une tâche supprimée n'a plus de ligne dans `tasks`
+    return (
+        select(
+            task_changes.c.seq,
+            task_changes.c.task_id,
+            task_changes.c.op,
+            task_changes.c.changed_at,
+            *TASK_COLUMNS,
+        )
+        .select_from(task_changes.outerjoin(TaskTable, TaskTable.id == task_changes.c.task_id))
+        .where(task_changes.c.seq > since)
+        .order_by(task_changes.c.seq)
+        .limit(limit)
+    )
+
+
+def changes_horizon_query():
+    return select(task_changes_horizon.c.seq).where(task_changes_horizon.c.id == 1)
+
+
+def compact_changes_query(deleted_before: datetime):
+    # Condition écrite en SQL littéral pour que SQLite utilise l'index partiel
+    return (
+        delete(task_changes)
+        .where(text("op = 'deleted'"), task_changes.c.changed_at < _utc(deleted_before))
+        .returning(task_changes.c.seq)
+    )
+
+
+def raise_horizon_query(seq: int):
+    return (
+        update(task_changes_horizon)
+        .where(task_changes_horizon.c.id == 1)
+        .values(seq=func.max(task_changes_horizon.c.seq, seq))
+    )
+
+
+def to_changes(rows, since: int, horizon: int) -> Optional[List[TaskChange]]:
+    if 0 < since < horizon:
+        return None
+    return [
+        TaskChange(
+            seq=seq,
+            task_id=task_id,
+            op=TaskEventType(op),
+            changed_at=changed_at.replace(tzinfo=timezone.utc),
+            task=to_task(task_row) if task_row[0] is not None else None,
+        )
+        for seq, task_id, op, changed_at, *task_row in rows
+    ]
+
+
+def _utc(moment: datetime) -> datetime:
+    """Heure UTC naïve, comme CURRENT_TIMESTAMP dans le journal."""
+    if moment.tzinfo is None:
+        return moment
+    return moment.astimezone(timezone.utc).replace(tzinfo=None)
+
+
+def count_by_status_query(today: date):
+    # Une tâche en cours échue compte déjà comme en retard, même avant le balayage
+    status = case(
+        (
+            (TaskTable.status == TaskStatus.IN_PROGRESS.value) & (TaskTable.due_date < today),
+            TaskStatus.OVERDUE.value,
+        ),
+        else_=TaskTable.status,
+    )
+    return select(status, func.count()).group_by(status)
+
+
+def to_counts(rows) -> Dict[TaskStatus, int]:
+    counts = {status: 0 for status in TaskStatus}
+    counts.update({TaskStatus(status): count for status, count in rows})
+    return counts
+
+
+def overdue_update_query(today: date):
+    return (
+        update(TaskTable)
+        .where(
+            TaskTable.status == TaskStatus.IN_PROGRESS.value,
+            TaskTable.due_date < today,
+        )
+        .values(status=TaskStatus.OVERDUE.value)
+        .returning(TaskTable.id)
+    )
+
+
+def get_one_query(task_id: int, columns: tuple = TASK_COLUMNS):
+    return select(*columns).where(TaskTable.id == task_id)
+
+
+def update_one_query(task: Task):
+    # Une seule requête : UPDATE ... RETURNING renvoie directement la ligne à jour
+    return (
+        update(TaskTable)
+        .where(TaskTable.id == task.id)
+        .values(**task_values(task))
+        .returning(*TASK_COLUMNS)
+    )
+
+
+def delete_many_query(task_ids: List[int]):
+    return delete(TaskTable).where(TaskTable.id.in_(task_ids)).returning(TaskTable.id)
+
+
+def task_values(task: Task) -> dict:
+    return {
+        "title": task.title,
+        "description": task.description,
+        "status": task.status.value,
+        "due_date": task.due_date,
+    }
+
+
+def to_task(row) -> Task:
+    """Task construite depuis une ligne (id, title, description, status, due_date)."""
+    # Lignes validées à l'insertion : pas de revalidation au chargement
+    return Task.from_row(*row)
+
+
+def to_fields(row) -> TaskFields:
+    """Projection construite depuis une ligne réduite : pas de Task partielle."""
+    values = dict(row._mapping)
+    if "status" in values:
+        values["status"] = TaskStatus(values["status"])
+    return values
 
 
 # =========================
@@ -62,8 +514,18 @@ class SQLiteTaskRepository(TaskRepository):
     Implémentation SQLite du port TaskRepository
     """
 
+    def __init__(self, database_url: Optional[str] = None):
+        self.database_url = database_url
+        self._sessionmaker: Optional[sessionmaker] = None
+
+    def _session(self) -> Session:
+        # L'engine (et le schéma) n'est créé qu'à la première requête
+        if self._sessionmaker is None:
+            self._sessionmaker = sessionmaker(bind=get_engine(self.database_url))
+        return self._sessionmaker()
+
     def add(self, task: Task) -> None:
-        with SessionLocal() as session:
+        with self._session() as session:
             orm_task = TaskTable(
                 title=task.title,
                 description=task.description,
@@ -74,9 +536,10 @@ class SQLiteTaskRepository(TaskRepository):
             session.add(orm_task)
             session.commit()
             session.refresh(orm_task)
+            task.id = orm_task.id
 
     def delete(self, task_id: int) -> None:
-        with SessionLocal() as session:
+        with self._session() as session:
             orm_task = session.get(TaskTable, task_id)
 
             if orm_task is None:
@@ -86,54 +549,149 @@ class SQLiteTaskRepository(TaskRepository):
             session.commit()
     
     def get(self, task_id: int) -> Task | None:
-        with SessionLocal() as session:
-            orm_task = session.get(TaskTable, task_id)
+        with self._session() as session:
+            row = session.connection().execute(get_one_query(task_id)).first()
+            return to_task(row) if row is not None else None
 
-            if orm_task is None:
-                return None
-            
-            return Task(
-                id=orm_task.id,
-                title=orm_task.title,
-                description=orm_task.description,
-                status=TaskStatus(orm_task.status),
-                due_date=orm_task.due_date,
-            )
+    def get_fields(self, task_id: int, fields: Collection[str]) -> Optional[TaskFields]:
+        with self._session() as session:
+            row = session.connection().execute(get_one_query(task_id, projection_columns(fields))).first()
+            return to_fields(row) if row is not None else None
 
     def update(self, task: Task) -> Task | None:
-        with SessionLocal() as session:
-            orm_task = session.get(TaskTable, task.id)
+        with self._session() as session:
+            row = session.connection().execute(update_one_query(task)).first()
+            session.commit()
+            return to_task(row) if row is not None else None
+        
+    def list(
+        self,
+        status: Optional[TaskStatus] = None,
+        due_from: Optional[date] = None,
+        due_to: Optional[date] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+    ) -> List[Task]:
+        query = list_query(status, due_from, due_to, limit, after_id, before_id)
 
-            if orm_task is None:
-                return None
+        with self._session() as session:
+            rows = session.connection().execute(query).all()
+        tasks = [to_task(row) for row in rows]
+        if before_id is not None:
+            tasks.reverse()
+        return tasks
+
+    def list_fields(
+        self,
+        fields: Collection[str],
+        status: Optional[TaskStatus] = None,
+        due_from: Optional[date] = None,
+        due_to: Optional[date] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List[TaskFields]:
+        query = list_query(status, due_from, due_to, limit, after_id, columns=projection_columns(fields))
+
+        with self._session() as session:
+            rows = session.connection().execute(query).all()
+        return [to_fields(row) for row in rows]
+
+    def search(self, query: str, limit: int = 50) -> List[Task]:
+        match = fts_query(query)
+        if match is None:
+            return []
+
+        with self._session() as session:
+            rows = session.connection().execute(search_query(match, limit)).all()
+        return [to_task(row) for row in rows]
+
+    def data_version(self) -> int:
+        with self._session() as session:
+            return session.connection().execute(data_version_query()).scalar_one()
+
+    def count_by_status(self, today: date) -> Dict[TaskStatus, int]:
+        with self._session() as session:
+            return to_counts(session.execute(count_by_status_query(today)))
+
+    def stream(
+        self,
+        status: Optional[TaskStatus] = None,
+        due_from: Optional[date] = None,
+        due_to: Optional[date] = None,
+        batch_size: int = 1000,
+    ) -> Iterator[Task]:
+        query = list_query(status, due_from, due_to).execution_options(yield_per=batch_size)
+
+        with self._session() as session:
+            # yield_per active stream_results : curseur côté serveur, lots de batch_size lignes
+            for row in session.connection().execute(query):
+                yield to_task(row)
 
-            orm_task.title = task.title
-            orm_task.description = task.description
-            orm_task.status = task.status.value
-            orm_task.due_date = task.due_date
+    def get_many(self, task_ids: List[int]) -> List[Task]:
+        if not task_ids:
+            return []
 
+        with self._session() as session:
+            rows = session.connection().execute(list_query().where(TaskTable.id.in_(task_ids))).all()
+        return [to_task(row) for row in rows]
+
+    def add_many(self, tasks: List[Task]) -> None:
+        if not tasks:
+            return
+
+        rows = [task_values(task) for task in tasks]
+        with self._session() as session:
+            # executemany groupé ; les ids reviennent dans l'ordre des lignes
+            ids = session.scalars(
+                insert(TaskTable).returning(TaskTable.id, sort_by_parameter_order=True),
+                rows,
+            ).all()
             session.commit()
-            session.refresh(orm_task)
 
-            return Task(
-                id=orm_task.id,
-                title=orm_task.title,
-                description=orm_task.description,
-                status=TaskStatus(orm_task.status),
-                due_date=orm_task.due_date,
-            )
-        
-    def list(self) -> list[Task]:
-        with SessionLocal() as session:
-            orm_tasks = session.query(TaskTable).all()
-            tasks = [
-                Task(
-                    id=orm_task.id,
-                    title=orm_task.title,
-                    description=orm_task.description,
-                    status=TaskStatus(orm_task.status),
-                    due_date=orm_task.due_date,
-                )
-                for orm_task in orm_tasks
-            ]
-            return tasks
+        for task, task_id in zip(tasks, ids):
+            task.id = task_id
+
+    def update_many(self, tasks: List[Task]) -> None:
+        if not tasks:
+            return
+
+        rows = [{"id": task.id, **task_values(task)} for task in tasks]
+        with self._session() as session:
+            # UPDATE ... WHERE id = ? en executemany
+            session.execute(update(TaskTable), rows)
+            session.commit()
+
+    def delete_many(self, task_ids: List[int]) -> List[int]:
+        if not task_ids:
+            return []
+
+        with self._session() as session:
+            result = session.execute(delete_many_query(task_ids))
+            deleted_ids = list(result.scalars())
+            session.commit()
+            return deleted_ids
+
+    def mark_overdue_before(self, today: date) -> List[int]:
+        with self._session() as session:
+            overdue_ids = list(session.scalars(overdue_update_query(today)))
+            session.commit()
+            return overdue_ids
+
+    def changes_since(self, since: int, limit: int = 1000) -> Optional[List[TaskChange]]:
+        with self._session() as session:
+            conn = session.connection()
+            rows = conn.execute(changes_query(since, limit)).all()
+            # Horizon lu après les changements : un compactage intercalé ne peut
+            # que rendre la réponse plus prudente (None), jamais incomplète
+            horizon = conn.execute(changes_horizon_query()).scalar_one()
+        return to_changes(rows, since, horizon)
+
+    def compact_changes(self, deleted_before: datetime) -> int:
+        with self._session() as session:
+            conn = session.connection()
+            seqs = conn.execute(compact_changes_query(deleted_before)).scalars().all()
+            if seqs:
+                conn.execute(raise_horizon_query(max(seqs)))
+            session.commit()
+            return len(seqs)
@@ -4,25 +4,57 @@ from textual.widgets import DataTable, Footer, Header, Static, OptionList, Input
 from textual.widgets.option_list import Option
 from textual.screen import ModalScreen
 from textual.binding import Binding
+from textual.message import Message
+from textual.timer import Timer
 
-from typing import Any, Optional
+import os
+from typing import TYPE_CHECKING, Any, Callable, Optional
 from functools import partial
 from datetime import date
 from pathlib import Path
-from whenever import Date as WheneverDate # type used to set date in DatePicker
-from textual_timepiece.pickers import DatePicker
 
 from todo.adapters.persistence.sqlite_repository import SQLiteTaskRepository, get_data_dir
-from todo.adapters.notifications.notif import Notif
+from todo.adapters.notifications.notif import BufferedNotifier, tail_lines
+from todo.adapters.notifications.watcher import FileWatcher
+from todo.application.ports import TaskRepository, Notifier
 from todo.application.use_cases import (
     create_task,
     delete_task,
     update_task,
     get_task,
     list_tasks,
+    page_tasks,
+    count_tasks_by_status,
+    search_tasks,
+    update_overdue_tasks,
     change_task_status,
 )
-from todo.domain.task import TaskStatus
+from todo.domain.task import Task, TaskStatus
+
+if TYPE_CHECKING:
+    # textual_timepiece et whenever ne sont importés qu'à l'ouverture d'un formulaire
+    from textual_timepiece.pickers import DatePicker
+
+
+# Nombre de lignes du journal chargées au démarrage
+ACTIVITY_LOG_LINES = 200
+
+# Fenêtre de regroupement des signaux du journal : une écriture de ce processus
+# arrive à la fois par le pub/sub et par le watcher, on ne lit qu'une fois
+ACTIVITY_DEBOUNCE = 0.05
+
+# Mode virtuel : au-delà de VIRTUAL_THRESHOLD tâches, le tableau ne garde
+# qu'une fenêtre de WINDOW_PAGES pages autour du curseur
+VIRTUAL_THRESHOLD = 5000
+PAGE_SIZE = 100
+WINDOW_PAGES = 3
+
+# Délai avant d'afficher le détail de la ligne surlignée : au défilement
+# rapide, seule la dernière ligne est rendue
+DETAILS_DEBOUNCE = 0.08
+
+# Nombre de résultats affichés par la recherche
+SEARCH_RESULTS = 20
 
 
 class Section(Container):
@@ -74,6 +106,8 @@ class CreateTaskScreen(ModalScreen[dict[str, Any] | None]):
     ]
 
     def compose(self) -> ComposeResult:
+        from textual_timepiece.pickers import DatePicker
+
         with Container(id="create_dialog"):
             yield Static("Create a task", id="create_title")
             yield Static("", id="create_error")
@@ -90,6 +124,10 @@ class CreateTaskScreen(ModalScreen[dict[str, Any] | None]):
                 id="create_actions",
             )
 
+    @property
+    def due_picker(self) -> "DatePicker":
+        return self.query_one("#create_due_input")
+
     def on_mount(self) -> None:
         self.query_one("#create_title_input", Input).focus()
 
@@ -101,7 +139,7 @@ class CreateTaskScreen(ModalScreen[dict[str, Any] | None]):
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id == "create_title_input":
-            self.query_one("#create_due_input", DatePicker).focus()
+            self.due_picker.focus()
 
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         if event.option_id == "create":
@@ -122,7 +160,7 @@ class CreateTaskScreen(ModalScreen[dict[str, Any] | None]):
             self.query_one("#create_title_input", Input).focus()
             return
 
-        picker = self.query_one("#create_due_input", DatePicker)
+        picker = self.due_picker
         due_before = picker.date
 
         if desc is not None and len(desc) > 115:
@@ -150,6 +188,8 @@ class EditTaskScreen(ModalScreen[dict[str, Any] | None]):
         self.initial_due_date = due_date
 
     def compose(self) -> ComposeResult:
+        from textual_timepiece.pickers import DatePicker
+
         with Container(id="edit_dialog"):
             yield Static(f"Edit task #{self.task_id}", id="edit_title")
             yield Static("", id="edit_error")
@@ -167,10 +207,16 @@ class EditTaskScreen(ModalScreen[dict[str, Any] | None]):
                 id="edit_actions",
             )
 
+    @property
+    def due_picker(self) -> "DatePicker":
+        return self.query_one("#edit_due_input")
+
     def on_mount(self) -> None:
+        from whenever import Date as WheneverDate # type used to set date in DatePicker
+
         title_in = self.query_one("#edit_title_input", Input)
         desc_in = self.query_one("#edit_desc_input", TextArea)
-        picker = self.query_one("#edit_due_input", DatePicker)
+        picker = self.due_picker
 
         title_in.value = self.initial_title
         desc_in.text = self.initial_description or ""
@@ -191,17 +237,17 @@ class EditTaskScreen(ModalScreen[dict[str, Any] | None]):
         self.submit()
 
     def action_clear_due(self) -> None:
-        self.query_one("#edit_due_input", DatePicker).action_clear()
-        self.query_one("#edit_due_input", DatePicker).focus()
+        self.due_picker.action_clear()
+        self.due_picker.focus()
 
     def on_input_submitted(self, event: Input.Submitted) -> None:
         if event.input.id == "edit_title_input":
-            self.query_one("#edit_due_input", DatePicker).focus()
+            self.due_picker.focus()
 
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         if event.option_id == "clear_due":
-            self.query_one("#edit_due_input", DatePicker).action_clear()
-            self.query_one("#edit_due_input", DatePicker).focus()
+            self.due_picker.action_clear()
+            self.due_picker.focus()
             return
 
         if event.option_id == "save":
@@ -222,7 +268,7 @@ class EditTaskScreen(ModalScreen[dict[str, Any] | None]):
             self.query_one("#edit_title_input", Input).focus()
             return
 
-        picker = self.query_one("#edit_due_input", DatePicker)
+        picker = self.due_picker
         due_before = picker.date
         due: date | None = None
         if due_before is not None:
@@ -236,6 +282,47 @@ class EditTaskScreen(ModalScreen[dict[str, Any] | None]):
 
         self.dismiss({"title": title, "due_date": due, "description": description})
 
+class SearchTaskScreen(ModalScreen[int | None]):
+    BINDINGS = [
+        ("escape", "cancel", "Cancel"),
+    ]
+
+    def __init__(self, search: Callable[[str], list[Task]]):
+        super().__init__()
+        self.search = search
+
+    def compose(self) -> ComposeResult:
+        with Container(id="search_dialog"):
+            yield Static("Search tasks", id="search_title")
+            yield Input(placeholder="Title or description words", id="search_input")
+            yield OptionList(id="search_results")
+
+    def on_mount(self) -> None:
+        self.query_one("#search_input", Input).focus()
+
+    def action_cancel(self) -> None:
+        self.dismiss(None)
+
+    def on_input_changed(self, event: Input.Changed) -> None:
+        # Une requête FTS5 par frappe : quelques millisecondes même sur une grosse base
+        results = self.query_one("#search_results", OptionList)
+        results.clear_options()
+        results.add_options(
+            Option(f"#{task.id} • {task.title}", id=str(task.id))
+            for task in self.search(event.value)
+        )
+
+    def on_input_submitted(self, event: Input.Submitted) -> None:
+        results = self.query_one("#search_results", OptionList)
+        if results.option_count:
+            results.highlighted = 0
+            results.focus()
+        else:
+            self.app.bell()
+
+    def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
+        self.dismiss(int(event.option_id) if event.option_id else None)
+
 class TaskTable(DataTable):
     BINDINGS = [
         Binding("enter", "open_actions", "Open action menu"),
@@ -266,16 +353,36 @@ class TaskApp(App):
     BINDINGS = [
         ("a", "add_task", "Add Task"),
         ("r", "refresh", "Refresh Tasks"),
+        ("slash", "search", "Search"),
         ("q", "quit", "Exit"),
     ]
 
-    def __init__(self):
+    class ActivityChanged(Message):
+        """Le journal des notifications a changé (ce processus ou un autre)."""
+
+    def __init__(
+        self,
+        repository: Optional[TaskRepository] = None,
+        notif_path: Optional[str] = None,
+        notifier: Optional[Notifier] = None,
+        virtual: Optional[bool] = None,
+    ):
         super().__init__()
-        self.repo = SQLiteTaskRepository()
-        self._notif_path = str(get_data_dir() / "notifications.txt")
+        self.repo = repository or SQLiteTaskRepository()
+        self._notif_path = notif_path or str(get_data_dir() / "notifications.txt")
         self._notif_offset = 0 # Ne pas lire les anciennes notifications
-        self.notifier = Notif(self._notif_path)
+        self._notif_inode: Optional[int] = None # Fichier lu jusqu'à _notif_offset
+        self.notifier = notifier or BufferedNotifier(self._notif_path)
         self._selected_task_id: Optional[int] = None
+        self._tasks: dict[int, Task] = {} # Modèle des lignes affichées, par id
+        self.virtual = virtual # None = décidé au montage selon le nombre de tâches
+        self._at_start = True # La fenêtre contient la première tâche
+        self._at_end = True # La fenêtre contient la dernière tâche
+        self._paging = False
+        self._details_timer: Optional[Timer] = None
+        self._activity_watcher: Optional[FileWatcher] = None
+        self._activity_unsubscribe = None
+        self._activity_pending = False
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -293,15 +400,30 @@ class TaskApp(App):
         self.theme = "rose-pine-moon"
 
         table = self.query_one("#task_table", DataTable)
-        table.add_column("ID", width=4)
-        table.add_column("Title", width=30)
-        table.add_column("Status", width=12)
-        table.add_column("Due Date", width=12)
+        table.add_column("ID", width=4, key="id")
+        table.add_column("Title", width=30, key="title")
+        table.add_column("Status", width=12, key="status")
+        table.add_column("Due Date", width=12, key="due_date")
         table.cursor_type = "row"
+        if self.virtual is None:
+            self.virtual = sum(count_tasks_by_status(self.repo).values()) > VIRTUAL_THRESHOLD
         self.refresh_task_table()
 
         self.init_activity_log()
-        self.set_interval(0.5, self.sec_notifications)
+
+        # Plus de scrutation périodique : pub/sub du notifier pour ce processus,
+        # watcher de fichier pour les écritures des autres (API)
+        subscribe = getattr(self.notifier, "subscribe", None)
+        if subscribe is not None:
+            self._activity_unsubscribe = subscribe(lambda lines: self.activity_changed())
+        self._activity_watcher = FileWatcher(self._notif_path, self.activity_changed)
+        self._activity_watcher.start()
+
+    def on_unmount(self) -> None:
+        if self._activity_unsubscribe is not None:
+            self._activity_unsubscribe()
+        if self._activity_watcher is not None:
+            self._activity_watcher.stop()
 
     def action_open_actions(self) -> None:
         table = self.query_one("#task_table", TaskTable)
@@ -316,7 +438,7 @@ class TaskApp(App):
             self.bell()
             return
 
-        task = get_task(self.repo, task_id)
+        task = self.cached_task(task_id)
         title = task.title if task else "Unknown"
 
         self.push_screen(
@@ -327,6 +449,21 @@ class TaskApp(App):
     def action_refresh(self) -> None:
         self.refresh_task_table(select_task_id=self._selected_task_id)
 
+    def action_search(self) -> None:
+        search = partial(search_tasks, self.repo, limit=SEARCH_RESULTS)
+        self.push_screen(SearchTaskScreen(search), callback=self.goto_task)
+
+    def goto_task(self, task_id: Optional[int]) -> None:
+        table = self.query_one("#task_table", DataTable)
+        table.focus()
+
+        if task_id is None:
+            return
+        if self.virtual and task_id not in self._tasks:
+            # Hors de la fenêtre : on la recharge à partir de la tâche trouvée
+            self.load_window(after_id=task_id - 1)
+        self.select_task_row(select_task_id=task_id)
+
     def action_add_task(self) -> None:
         self.push_screen(CreateTaskScreen(), callback=self.create_task)
 
@@ -351,27 +488,175 @@ class TaskApp(App):
             )
         except TypeError:
             created = create_task(repository=self.repo, notifier=self.notifier, title=title, due_date=due_date)
+        self.sweep_overdue(created)
 
-        created_id = getattr(created, "id", None)
-        self.refresh_task_table(select_task_id=created_id)
+        if self.virtual and not self._at_end:
+            # La nouvelle tâche est la dernière : on saute à la fin de la liste
+            self.load_window(before_id=created.id + 1)
+        else:
+            self.sync_task_row(created)
+        self.update_stats()
+        self.select_task_row(select_task_id=created.id)
 
     # ---------------- Table ----------------
 
     def refresh_task_table(self, select_task_id: Optional[int] = None, fallback_row: Optional[int] = None) -> None:
+        """
+        Recharge les tâches (toutes, ou la fenêtre courante en mode virtuel)
+        et n'applique au tableau que les lignes qui ont changé.
+        """
+        table = self.query_one("#task_table", DataTable)
+
+        if self.virtual:
+            # Un seul balayage des retards ici : les pages chargées au défilement sont en lecture seule
+            update_overdue_tasks(self.repo)
+            first = min(self._tasks, default=None)
+            tasks, more = self.fetch_page(PAGE_SIZE * WINDOW_PAGES, after_id=first - 1 if first else None)
+            self._at_start = first is None or not self.has_tasks_before(first)
+            self._at_end = not more
+        else:
+            tasks = list_tasks(self.repo)
+        fresh = {task.id: task for task in tasks}
+
+        for task_id in self._tasks.keys() - fresh.keys():
+            self.remove_task_row(task_id)
+
+        # Les nouvelles lignes sont ajoutées en fin de tableau : si un id réutilisé
+        # s'intercale, on retrie plutôt que casser l'ordre par id
+        new_ids = fresh.keys() - self._tasks.keys()
+        reorder = bool(new_ids) and min(new_ids) < max(self._tasks, default=0)
+
+        for task in tasks:
+            self.sync_task_row(task)
+        if reorder:
+            table.sort("id", key=int)
+
+        self.update_stats()
+        self.select_task_row(select_task_id, fallback_row)
+
+    def task_cells(self, task: Task) -> tuple[str, str, str, str]:
+        return (
+            str(task.id),
+            task.title,
+            task.status.value,
+            task.due_date.isoformat() if task.due_date else "N/A",
+        )
+
+    def sync_task_row(self, task: Task) -> None:
+        """Ajoute la ligne de la tâche, ou ne met à jour que ses cellules modifiées."""
+        table = self.query_one("#task_table", DataTable)
+        cells = self.task_cells(task)
+        previous = self._tasks.get(task.id)
+
+        if previous is None:
+            table.add_row(*cells, key=str(task.id))
+        else:
+            for column, old, new in zip(table.columns, self.task_cells(previous), cells):
+                if old != new:
+                    table.update_cell(str(task.id), column, new)
+
+        self._tasks[task.id] = task
+
+    def remove_task_row(self, task_id: int) -> None:
         table = self.query_one("#task_table", DataTable)
+        if self._tasks.pop(task_id, None) is not None:
+            table.remove_row(str(task_id))
+
+    # ---------------- Virtual mode ----------------
+
+    def load_window(self, after_id: Optional[int] = None, before_id: Optional[int] = None) -> None:
+        """Remplace le contenu du tableau par une fenêtre complète autour d'un curseur."""
+        table = self.query_one("#task_table", DataTable)
+        size = PAGE_SIZE * WINDOW_PAGES
+
+        tasks, more = self.fetch_page(size, after_id=after_id, before_id=before_id)
         table.clear()
+        self._tasks = {}
+        for task in tasks:
+            self.sync_task_row(task)
 
-        tasks = list_tasks(self.repo)
+        if before_id is not None:
+            self._at_start = not more
+            self._at_end = True
+        else:
+            self._at_start = not tasks or not self.has_tasks_before(tasks[0].id)
+            self._at_end = not more
+
+    def fetch_page(
+        self,
+        limit: int,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+    ) -> tuple[list[Task], bool]:
+        """
+        Page de `limit` tâches, et s'il en reste au-delà dans le sens de lecture :
+        on lit une tâche de plus (comme l'API), même quand la dernière page est pleine.
+        """
+        tasks = page_tasks(self.repo, limit + 1, after_id=after_id, before_id=before_id)
+        more = len(tasks) > limit
+        if more:
+            # Vers l'arrière, la tâche en trop est la plus ancienne (tri par id)
+            tasks = tasks[1:] if before_id is not None else tasks[:limit]
+        return tasks, more
+
+    def has_tasks_before(self, task_id: int) -> bool:
+        return bool(page_tasks(self.repo, 1, before_id=task_id))
+
+    def page_around_cursor(self) -> None:
+        """Charge la page voisine quand le curseur approche d'un bord de la fenêtre."""
+        table = self.query_one("#task_table", DataTable)
+        if self._paging or table.row_count == 0:
+            return
+
+        margin = PAGE_SIZE // 4
+        self._paging = True
+        try:
+            if table.cursor_row >= table.row_count - margin and not self._at_end:
+                self.load_next_page()
+            elif table.cursor_row < margin and not self._at_start:
+                self.load_previous_page()
+        finally:
+            self._paging = False
+
+    def load_next_page(self) -> None:
+        table = self.query_one("#task_table", DataTable)
+        cursor_key = table.ordered_rows[table.cursor_row].key
+
+        tasks, more = self.fetch_page(PAGE_SIZE, after_id=max(self._tasks))
+        self._at_end = not more
         for task in tasks:
-            table.add_row(
-                str(task.id),
-                task.title,
-                task.status.value,
-                task.due_date.isoformat() if task.due_date else "N/A",
-                key=str(task.id),
-            )
-        
-        self.update_stats(tasks)
+            self.sync_task_row(task)
+
+        # Les pages du début sortent de la fenêtre
+        excess = len(self._tasks) - PAGE_SIZE * WINDOW_PAGES
+        if excess > 0:
+            for task_id in sorted(self._tasks)[:excess]:
+                self.remove_task_row(task_id)
+            self._at_start = False
+        table.move_cursor(row=table.get_row_index(cursor_key), scroll=True)
+
+    def load_previous_page(self) -> None:
+        table = self.query_one("#task_table", DataTable)
+        cursor_key = table.ordered_rows[table.cursor_row].key
+
+        tasks, more = self.fetch_page(PAGE_SIZE, before_id=min(self._tasks))
+        self._at_start = not more
+        if not tasks:
+            return
+        for task in tasks:
+            self.sync_task_row(task)
+        table.sort("id", key=int)
+
+        # Les pages de la fin sortent de la fenêtre
+        excess = len(self._tasks) - PAGE_SIZE * WINDOW_PAGES
+        if excess > 0:
+            for task_id in sorted(self._tasks)[-excess:]:
+                self.remove_task_row(task_id)
+            self._at_end = False
+        table.move_cursor(row=table.get_row_index(cursor_key), scroll=True)
+
+    def select_task_row(self, select_task_id: Optional[int] = None, fallback_row: Optional[int] = None) -> None:
+        table = self.query_one("#task_table", DataTable)
 
         if table.row_count == 0:
             self._selected_task_id = None
@@ -395,7 +680,11 @@ class TaskApp(App):
 
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         self._selected_task_id = self.row_key_to_task_id(event.row_key)
-        self.update_details(event.row_key)
+        if self._details_timer is not None:
+            self._details_timer.stop()
+        self._details_timer = self.set_timer(DETAILS_DEBOUNCE, partial(self.update_details, event.row_key))
+        if self.virtual:
+            self.page_around_cursor()
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         task_id = self.row_key_to_task_id(event.row_key)
@@ -403,7 +692,7 @@ class TaskApp(App):
             self.bell()
             return
 
-        task = get_task(self.repo, task_id)
+        task = self.cached_task(task_id)
         title = task.title if task else "Unknown"
 
         self.push_screen(
@@ -420,7 +709,7 @@ class TaskApp(App):
             return
 
         if action == "edit":
-            task = get_task(self.repo, task_id)
+            task = self.cached_task(task_id)
             if not task:
                 self.bell()
                 table.focus()
@@ -434,28 +723,51 @@ class TaskApp(App):
 
         if action == "delete":
             delete_task(self.repo, self.notifier, task_id)
-            self.refresh_task_table(select_task_id=None, fallback_row=fallback_row)
+            self.remove_task_row(task_id)
+            self.update_stats()
+            self.select_task_row(select_task_id=None, fallback_row=fallback_row)
             table.focus()
             return
 
+        updated = None
         if action == "done":
-            change_task_status(
+            updated = change_task_status(
                 repository=self.repo,
                 notifier=self.notifier,
                 task_id=task_id,
                 new_status=TaskStatus.DONE,
             )
         elif action == "in_progress":
-            change_task_status(
+            updated = change_task_status(
                 repository=self.repo,
                 notifier=self.notifier,
                 task_id=task_id,
                 new_status=TaskStatus.IN_PROGRESS,
             )
 
-        self.refresh_task_table(select_task_id=task_id, fallback_row=fallback_row)
+        self.apply_task_change(task_id, updated, fallback_row)
         table.focus()
 
+    def apply_task_change(self, task_id: int, updated: Optional[Task], fallback_row: Optional[int]) -> None:
+        """Répercute une action sur une seule tâche : seule sa ligne est touchée."""
+        if updated is None:
+            # La tâche a disparu entre-temps (supprimée ailleurs)
+            self.remove_task_row(task_id)
+        else:
+            self.sweep_overdue(updated)
+            self.sync_task_row(updated)
+        self.update_stats()
+        self.select_task_row(select_task_id=getattr(updated, "id", None), fallback_row=fallback_row)
+
+    def sweep_overdue(self, task: Task) -> None:
+        """
+        Tâche tout juste écrite, affichée sans recharger la liste : si son échéance
+        est passée, le retard est persisté (balayage) et reporté sur la ligne.
+        """
+        if task.is_overdue():
+            update_overdue_tasks(self.repo)
+            task.mark_overdue()
+
     def edit_task(self, task_id: int, fallback_row: int, payload: dict[str, Any] | None) -> None:
         table = self.query_one("#task_table", DataTable)
         table.focus()
@@ -473,8 +785,17 @@ class TaskApp(App):
             status=None,
         )
 
-        selected = getattr(updated, "id", None) or task_id
-        self.refresh_task_table(select_task_id=selected, fallback_row=fallback_row)
+        self.apply_task_change(task_id, updated, fallback_row)
+
+    def cached_task(self, task_id: int) -> Optional[Task]:
+        """
+        Tâche lue dans le modèle du tableau, tenu à jour par refresh_task_table
+        et par chaque action : la base n'est lue que pour une ligne absente.
+        """
+        task = self._tasks.get(task_id)
+        if task is None:
+            task = get_task(self.repo, task_id)
+        return task
 
     def row_key_to_task_id(self, row_key) -> int | None:
         key_value = getattr(row_key, "value", row_key)
@@ -497,7 +818,7 @@ class TaskApp(App):
             details.update("No task selected.")
             return
 
-        task = get_task(self.repo, task_id)
+        task = self.cached_task(task_id)
         if not task:
             details.update("Task not found.")
             return
@@ -525,13 +846,15 @@ class TaskApp(App):
 
     # ---------------- Stats ----------------
 
-    def update_stats(self, tasks) -> None:
-        total = len(tasks)
-        done = sum(1 for t in tasks if t.status == TaskStatus.DONE)
-        in_progress = sum(1 for t in tasks if t.status == TaskStatus.IN_PROGRESS)
-        today = date.today()
-        overdue = sum(1 for t in tasks if t.status == TaskStatus.OVERDUE)
+    def update_stats(self) -> None:
+        # COUNT/GROUP BY côté base : le tableau ne contient pas forcément toutes les tâches
+        counts = count_tasks_by_status(self.repo)
+        total = sum(counts.values())
+        done = counts[TaskStatus.DONE]
+        in_progress = counts[TaskStatus.IN_PROGRESS]
+        overdue = counts[TaskStatus.OVERDUE]
 
+        self.query_one("#tasks_section", Section).border_title = f"Tasks list ({total})"
         self.query_one("#lbl_done", Static).update(f"Done {done}/{total}")
         self.query_one("#lbl_in_progress", Static).update(f"In Progress {in_progress}/{total}")
         self.query_one("#lbl_overdue", Static).update(f"Overdue {overdue}/{total}")
@@ -553,31 +876,61 @@ class TaskApp(App):
         log = self.query_one("#activity_log", RichLog)
         log.clear()
 
+        # Seulement la fin du journal : le fichier peut contenir des mois d'historique
         try:
-            with open(self._notif_path, "r", encoding="utf-8") as f:
-                for line in f.read().splitlines():
-                    if line.strip():
-                        log.write(line)
-                self._notif_offset = f.tell()
+            lines, self._notif_offset = tail_lines(self._notif_path, ACTIVITY_LOG_LINES)
+            self._notif_inode = os.stat(self._notif_path).st_ino
         except FileNotFoundError:
             self._notif_offset = 0
+            self._notif_inode = None
+            return
+
+        for line in lines:
+            if line.strip():
+                log.write(line)
+
+
+    def activity_changed(self) -> None:
+        # Appelé depuis n'importe quel thread ; post_message est thread-safe.
+        # Les signaux reçus pendant ACTIVITY_DEBOUNCE sont fusionnés en une seule lecture.
+        if self._activity_pending:
+            return
+        self._activity_pending = True
+        self.post_message(self.ActivityChanged())
+
+    def on_task_app_activity_changed(self, message: ActivityChanged) -> None:
+        self.set_timer(ACTIVITY_DEBOUNCE, self.read_activity)
 
+    def read_activity(self) -> None:
+        self._activity_pending = False
+        self.sec_notifications()
 
     def sec_notifications(self) -> None:
         log = self.query_one("#activity_log", RichLog)
 
         try:
-            with open(self._notif_path, "r", encoding="utf-8") as f:
+            with open(self._notif_path, "rb") as f:
+                # Autre fichier (inode) ou plus court que l'offset : il vient d'être
+                # archivé (rotation), le nouveau se lit depuis le début même s'il a
+                # déjà dépassé l'ancien offset
+                stat = os.fstat(f.fileno())
+                if stat.st_ino != self._notif_inode or stat.st_size < self._notif_offset:
+                    self._notif_inode = stat.st_ino
+                    self._notif_offset = 0
+                if stat.st_size == self._notif_offset:
+                    return
                 f.seek(self._notif_offset)
                 chunk = f.read()
-                self._notif_offset = f.tell()
         except FileNotFoundError:
             return
 
-        if not chunk:
+        # On ne consomme que des lignes complètes
+        end = chunk.rfind(b"\n") + 1
+        if not end:
             return
+        self._notif_offset += end
 
-        for line in chunk.splitlines():
+        for line in chunk[:end].decode("utf-8", errors="replace").splitlines():
             if line.strip():
                 log.write(line)
 
@@ -0,0 +1,259 @@
+# Versions asynchrones des use cases, pour les adapters qui tournent dans une boucle asyncio (API).
+# Les règles métier sont partagées avec use_cases.py (task_rules.py) ; seuls les appels au repository sont attendus.
+from typing import Any, AsyncIterator, Collection, Optional
+from datetime import date, datetime, timedelta, timezone
+
+from todo.domain.task import Task, TaskStatus
+from todo.application.ports import AsyncTaskRepository, EventPublisher, Notifier, TaskChange, TaskEventType, TaskFields
+from todo.application.task_rules import (
+    new_task,
+    apply_update,
+    apply_status,
+    derive_overdue,
+    derive_overdue_fields,
+    derive_changes,
+    with_overdue_inputs,
+    prepare_creates,
+    prepare_updates,
+    missing_errors,
+    deletion_messages,
+    publish,
+    publish_deleted,
+    update_event,
+)
+
+
+# =========================
+# Création d'une tache
+# =========================
+
+async def create_task(
+    repository: AsyncTaskRepository,
+    notifier: Notifier,
+    title: str,
+    description: Optional[str] = None,
+    due_date: Optional[date] = None,
+    publisher: Optional[EventPublisher] = None,
+) -> Task:
+    task = new_task(title, description, due_date)
+    await repository.add(task)
+    notifier.notify(f"Tâche créée : {task.title} (id={task.id})")
+    publish(publisher, TaskEventType.CREATED, task)
+    return task
+
+
+# =========================
+# Suppression d'une tache
+# =========================
+
+async def delete_task(
+    repository: AsyncTaskRepository,
+    notifier: Notifier,
+    task_id: int,
+    publisher: Optional[EventPublisher] = None,
+) -> bool:
+    task = await repository.get(task_id)
+    if task is None:
+        return False
+
+    await repository.delete(task_id)
+    notifier.notify(f"Tâche supprimée : {task.title} (id={task.id})")
+    publish_deleted(publisher, [task_id])
+    return True
+
+
+# =========================
+# Récuperation tache
+# =========================
+
+async def get_task(repository: AsyncTaskRepository, task_id: int) -> Optional[Task]:
+    task = await repository.get(task_id)
+    return derive_overdue(task) if task is not None else None
+
+async def get_task_fields(
+    repository: AsyncTaskRepository, task_id: int, fields: Collection[str]
+) -> Optional[TaskFields]:
+    values = await repository.get_fields(task_id, with_overdue_inputs(fields))
+    return derive_overdue_fields(values) if values is not None else None
+
+async def list_tasks(
+    repository: AsyncTaskRepository,
+    status: Optional[TaskStatus] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
+    sweep: bool = True,
+) -> list[Task]:
+    # sweep=False : l'appelant a déjà fait le balayage (une seule transaction d'écriture)
+    if sweep:
+        await update_overdue_tasks(repository)
+    return await repository.list(
+        status=status,
+        due_from=due_from,
+        due_to=due_to,
+        limit=limit,
+        after_id=after_id,
+    )
+
+async def list_task_fields(
+    repository: AsyncTaskRepository,
+    fields: Collection[str],
+    status: Optional[TaskStatus] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
+    sweep: bool = True,
+) -> list[TaskFields]:
+    if sweep:
+        await update_overdue_tasks(repository)
+    return await repository.list_fields(
+        fields,
+        status=status,
+        due_from=due_from,
+        due_to=due_to,
+        limit=limit,
+        after_id=after_id,
+    )
+
+async def export_tasks(
+    repository: AsyncTaskRepository,
+    status: Optional[TaskStatus] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+) -> AsyncIterator[Task]:
+    await update_overdue_tasks(repository)
+    return repository.stream(status=status, due_from=due_from, due_to=due_to)
+
+async def search_tasks(repository: AsyncTaskRepository, query: str, limit: int = 50) -> list[Task]:
+    return [derive_overdue(task) for task in await repository.search(query, limit)]
+
+async def get_data_version(repository: AsyncTaskRepository) -> int:
+    return await repository.data_version()
+
+async def count_tasks_by_status(repository: AsyncTaskRepository) -> dict[TaskStatus, int]:
+    return await repository.count_by_status(date.today())
+
+
+# =========================
+# Synchronisation incrémentale
+# =========================
+
+async def list_changes(
+    repository: AsyncTaskRepository, since: int, limit: int = 1000
+) -> Optional[list[TaskChange]]:
+    return derive_changes(await repository.changes_since(since, limit))
+
+async def compact_changes(repository: AsyncTaskRepository, retention: timedelta) -> int:
+    return await repository.compact_changes(datetime.now(timezone.utc) - retention)
+
+
+# =========================
+# Mise à jour des teches en retard
+# =========================
+
+async def update_overdue_tasks(repository: AsyncTaskRepository) -> list[int]:
+    return await repository.mark_overdue_before(date.today())
+
+
+# =========================
+# Mise a jour d'une tache
+# =========================
+
+async def update_task(
+    repository: AsyncTaskRepository,
+    notifier: Notifier,
+    task_id: int,
+    title: Optional[str] = None,
+    description: Optional[str] = None,
+    status: Optional[str] = None,
+    due_date: Optional[date] = None,
+    publisher: Optional[EventPublisher] = None,
+) -> Optional[Task]:
+    task = await repository.get(task_id)
+    if task is None:
+        return None
+
+    old_status = task.status
+    changed = apply_update(task, title, description, status, due_date)
+    updated = await repository.update(task)
+    if changed:
+        notifier.notify(f"Tâche modifiée : {task.title} (id={task.id})")
+        publish(publisher, update_event(old_status, task), task)
+    return updated
+
+
+# =========================
+# Changement de statut
+# =========================
+
+async def change_task_status(
+    repository: AsyncTaskRepository,
+    notifier: Notifier,
+    task_id: int,
+    new_status: TaskStatus,
+    publisher: Optional[EventPublisher] = None,
+) -> Optional[Task]:
+    task = await repository.get(task_id)
+    if task is None:
+        return None
+
+    message = apply_status(task, new_status)
+    if message is not None:
+        notifier.notify(message)
+
+    await repository.update(task)
+    if message is not None:
+        publish(publisher, TaskEventType.STATUS_CHANGED, task)
+    return task
+
+
+# =========================
+# Opérations par lot
+# =========================
+
+async def create_tasks(
+    repository: AsyncTaskRepository,
+    notifier: Notifier,
+    items: list[dict[str, Any]],
+    publisher: Optional[EventPublisher] = None,
+) -> tuple[list[Task], dict[int, str]]:
+    tasks, errors = prepare_creates(items)
+    if tasks:
+        await repository.add_many(tasks)
+        notifier.notify_many([f"Tâche créée : {task.title} (id={task.id})" for task in tasks])
+        for task in tasks:
+            publish(publisher, TaskEventType.CREATED, task)
+    return tasks, errors
+
+
+async def update_tasks(
+    repository: AsyncTaskRepository,
+    notifier: Notifier,
+    items: list[dict[str, Any]],
+    publisher: Optional[EventPublisher] = None,
+) -> tuple[list[Task], dict[int, str]]:
+    existing = await repository.get_many([item["id"] for item in items])
+    tasks, errors, messages, events = prepare_updates(items, existing)
+    if tasks:
+        await repository.update_many(tasks)
+    if messages:
+        notifier.notify_many(messages)
+    for event_type, task in events:
+        publish(publisher, event_type, task)
+    return tasks, errors
+
+
+async def delete_tasks(
+    repository: AsyncTaskRepository,
+    notifier: Notifier,
+    task_ids: list[int],
+    publisher: Optional[EventPublisher] = None,
+) -> tuple[list[int], dict[int, str]]:
+    existing = {task.id: task for task in await repository.get_many(task_ids)}
+    deleted = await repository.delete_many(list(existing))
+    if deleted:
+        notifier.notify_many(deletion_messages(existing, deleted))
+        publish_deleted(publisher, deleted)
+    return deleted, missing_errors(task_ids, existing)
@@ -1,7 +1,36 @@
 from abc import ABC, abstractmethod
-from typing import List
+from dataclasses import dataclass
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, AsyncIterator, Collection, Dict, Iterator, List, Optional
 
-from todo.domain.task import Task
+from todo.domain.task import Task, TaskStatus
+
+
+# =========================
+# Changements de tâches
+# =========================
+
+class TaskEventType(str, Enum):
+    CREATED = "created"
+    UPDATED = "updated"
+    STATUS_CHANGED = "status_changed"
+    DELETED = "deleted"
+
+
+@dataclass(frozen=True)
+class TaskChange:
+    """Dernier changement connu d'une tâche dans le journal de synchronisation."""
+    seq: int
+    task_id: int
+    op: TaskEventType  # CREATED, UPDATED ou DELETED
+    changed_at: datetime
+    task: Optional[Task]  # État actuel, None si la tâche est supprimée
+
+
+# Projection d'une tâche (?fields=) : l'id et les champs demandés seulement, le
+# statut en TaskStatus. Une Task, elle, est toujours complète.
+TaskFields = Dict[str, Any]
 
 
 # =========================
@@ -23,12 +52,209 @@ class TaskRepository(ABC):
     def get(self, task_id: int) -> Task | None:
         pass
 
+    @abstractmethod
+    def get_fields(self, task_id: int, fields: Collection[str]) -> Optional[TaskFields]:
+        """Comme get, mais seules les colonnes `fields` (et l'id) sont lues."""
+        pass
+
     @abstractmethod
     def update(self, task: Task) -> Task | None:
         pass
 
     @abstractmethod
-    def list(self) -> List[Task]:
+    def list(
+        self,
+        status: Optional[TaskStatus] = None,
+        due_from: Optional[date] = None,
+        due_to: Optional[date] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+    ) -> List[Task]:
+        """
+        Liste les tâches triées par id, filtrées et paginées par curseur :
+        after_id pour la page suivante, before_id pour la page précédente.
+        """
+        pass
+
+    @abstractmethod
+    def list_fields(
+        self,
+        fields: Collection[str],
+        status: Optional[TaskStatus] = None,
+        due_from: Optional[date] = None,
+        due_to: Optional[date] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List[TaskFields]:
+        """Comme list (page suivante seulement), réduit aux colonnes `fields` et à l'id."""
+        pass
+
+    @abstractmethod
+    def search(self, query: str, limit: int = 50) -> List[Task]:
+        """Recherche plein texte sur titre et description, les plus pertinentes d'abord."""
+        pass
+
+    @abstractmethod
+    def data_version(self) -> int:
+        """
+        Version des données, strictement croissante : elle change dès qu'une
+        tâche est créée, modifiée ou supprimée, y compris par un autre processus.
+        """
+        pass
+
+    @abstractmethod
+    def count_by_status(self, today: date) -> Dict[TaskStatus, int]:
+        """
+        Nombre de tâches par statut en une requête GROUP BY (tous les statuts
+        présents, 0 si aucune). Les tâches en cours échues avant `today`
+        sont comptées en retard.
+        """
+        pass
+
+    @abstractmethod
+    def stream(
+        self,
+        status: Optional[TaskStatus] = None,
+        due_from: Optional[date] = None,
+        due_to: Optional[date] = None,
+    ) -> Iterator[Task]:
+        """Parcourt les tâches triées par id sans les charger toutes en mémoire."""
+        pass
+
+    @abstractmethod
+    def get_many(self, task_ids: List[int]) -> List[Task]:
+        pass
+
+    @abstractmethod
+    def add_many(self, tasks: List[Task]) -> None:
+        """Insère un lot de tâches en une transaction et renseigne leurs ids."""
+        pass
+
+    @abstractmethod
+    def update_many(self, tasks: List[Task]) -> None:
+        """Met à jour un lot de tâches existantes en une transaction."""
+        pass
+
+    @abstractmethod
+    def delete_many(self, task_ids: List[int]) -> List[int]:
+        """Supprime un lot de tâches en une transaction, retourne les ids supprimés."""
+        pass
+
+    @abstractmethod
+    def mark_overdue_before(self, today: date) -> List[int]:
+        """Passe en OVERDUE les tâches en cours échues avant `today`, retourne leurs ids."""
+        pass
+
+    @abstractmethod
+    def changes_since(self, since: int, limit: int = 1000) -> Optional[List[TaskChange]]:
+        """
+        Changements de numéro > `since` par ordre croissant, un seul (le dernier)
+        par tâche. None si des suppressions postérieures à `since` ont été
+        compactées : le client doit tout recharger (since=0 reste toujours valide).
+        """
+        pass
+
+    @abstractmethod
+    def compact_changes(self, deleted_before: datetime) -> int:
+        """Oublie les suppressions antérieures à `deleted_before`, retourne leur nombre."""
+        pass
+
+
+class AsyncTaskRepository(ABC):
+    """Version asynchrone de TaskRepository (mêmes opérations, mêmes contrats)."""
+
+    @abstractmethod
+    async def add(self, task: Task) -> None:
+        pass
+
+    @abstractmethod
+    async def delete(self, task_id: int) -> None:
+        pass
+
+    @abstractmethod
+    async def get(self, task_id: int) -> Task | None:
+        pass
+
+    @abstractmethod
+    async def get_fields(self, task_id: int, fields: Collection[str]) -> Optional[TaskFields]:
+        pass
+
+    @abstractmethod
+    async def update(self, task: Task) -> Task | None:
+        pass
+
+    @abstractmethod
+    async def list(
+        self,
+        status: Optional[TaskStatus] = None,
+        due_from: Optional[date] = None,
+        due_to: Optional[date] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+        before_id: Optional[int] = None,
+    ) -> List[Task]:
+        pass
+
+    @abstractmethod
+    async def list_fields(
+        self,
+        fields: Collection[str],
+        status: Optional[TaskStatus] = None,
+        due_from: Optional[date] = None,
+        due_to: Optional[date] = None,
+        limit: Optional[int] = None,
+        after_id: Optional[int] = None,
+    ) -> List[TaskFields]:
+        pass
+
+    @abstractmethod
+    async def search(self, query: str, limit: int = 50) -> List[Task]:
+        pass
+
+    @abstractmethod
+    async def data_version(self) -> int:
+        pass
+
+    @abstractmethod
+    async def count_by_status(self, today: date) -> Dict[TaskStatus, int]:
+        pass
+
+    @abstractmethod
+    def stream(
+        self,
+        status: Optional[TaskStatus] = None,
+        due_from: Optional[date] = None,
+        due_to: Optional[date] = None,
+    ) -> AsyncIterator[Task]:
+        pass
+
+    @abstractmethod
+    async def get_many(self, task_ids: List[int]) -> List[Task]:
+        pass
+
+    @abstractmethod
+    async def add_many(self, tasks: List[Task]) -> None:
+        pass
+
+    @abstractmethod
+    async def update_many(self, tasks: List[Task]) -> None:
+        pass
+
+    @abstractmethod
+    async def delete_many(self, task_ids: List[int]) -> List[int]:
+        pass
+
+    @abstractmethod
+    async def mark_overdue_before(self, today: date) -> List[int]:
+        pass
+
+    @abstractmethod
+    async def changes_since(self, since: int, limit: int = 1000) -> Optional[List[TaskChange]]:
+        pass
+
+    @abstractmethod
+    async def compact_changes(self, deleted_before: datetime) -> int:
         pass
 
 # =========================
@@ -41,3 +267,21 @@ class Notifier(ABC):
     @abstractmethod
     def notify(self, message: str) -> None:
         pass
+
+    def notify_many(self, messages: List[str]) -> None:
+        """Notifie un lot de messages (une écriture si l'adapter le permet)."""
+        for message in messages:
+            self.notify(message)
+
+
+# =========================
+# Port de diffusion des changements
+# =========================
+
+class EventPublisher(ABC):
+    """Port pour diffuser les changements de tâches aux clients abonnés."""
+
+    @abstractmethod
+    def publish(self, event_type: TaskEventType, task_id: int, task: Optional[Task] = None) -> None:
+        """Publie un changement ; task est None pour une suppression."""
+        pass
@@ -0,0 +1,202 @@
+# Règles métier partagées par use_cases.py et async_use_cases.py : aucun appel au
+# repository ici, seulement la préparation des tâches, des erreurs et des événements.
+from typing import Any, Collection, Optional
+from datetime import date
+
+from todo.domain.task import Task, TaskStatus, InvalidTaskTitle, is_past_due
+from todo.application.ports import EventPublisher, TaskChange, TaskEventType, TaskFields
+
+
+# =========================
+# Création et modification
+# =========================
+
+def new_task(
+    title: str,
+    description: Optional[str] = None,
+    due_date: Optional[date] = None,
+) -> Task:
+    if not title or len(title) > 30:
+        raise ValueError("Title is required and must be 1-30 characters long.")
+    if description is not None and len(description) > 115:
+        raise ValueError("Description must not exceed 115 characters.")
+    return Task(
+        id=0, # Def par la BDD en auto increment
+        title=title,
+        description=description,
+        due_date=due_date,
+    )
+
+
+def apply_update(
+    task: Task,
+    title: Optional[str],
+    description: Optional[str],
+    status: Optional[str],
+    due_date: Optional[date],
+) -> bool:
+    """Applique les modifications à la tâche, retourne True si elle a changé."""
+    before = (task.title, task.description, task.status, task.due_date)
+
+    if title is not None:
+        if not title or len(title) > 30:
+            raise ValueError("Title is required and must be 1-30 characters long.")
+        task.title = title
+    if description is not None:
+        if len(description) > 115:
+            raise ValueError("Description must not exceed 115 characters.")
+        task.description = description
+    if status is not None:
+        task.status = TaskStatus(status)
+        if task.is_overdue():
+            task.mark_overdue()
+    if due_date is not None:
+        task.due_date = due_date
+        if (task.status == TaskStatus.OVERDUE and due_date >= date.today()):
+            task.status = TaskStatus.IN_PROGRESS
+    else:
+        task.due_date = None
+
+    after = (task.title, task.description, task.status, task.due_date)
+    return before != after
+
+
+def apply_status(task: Task, new_status: TaskStatus) -> Optional[str]:
+    """Change le statut de la tâche, retourne le message à notifier s'il a changé."""
+    old_status = task.status
+
+    if new_status == TaskStatus.DONE:
+        task.mark_done()
+    elif new_status == TaskStatus.IN_PROGRESS:
+        task.mark_in_progress()
+
+    if task.is_overdue():
+        task.mark_overdue()
+
+    if old_status == task.status:
+        return None
+    return f"Tache {task.id} : statut changé de {old_status.value} à {task.status.value}"
+
+
+# =========================
+# Retard dérivé à la lecture
+# =========================
+
+def with_overdue_inputs(fields: Collection[str]) -> set[str]:
+    """Projection d'une lecture sans balayage : le statut dérivé a besoin de l'échéance."""
+    return {*fields, "due_date"} if "status" in fields else set(fields)
+
+
+def derive_overdue(task: Task) -> Task:
+    """
+    Statut OVERDUE calculé à la lecture. Sa persistance est laissée au
+    balayage (update_overdue_tasks) fait par les listes.
+    """
+    if task.is_overdue():
+        task.mark_overdue()
+    return task
+
+
+def derive_overdue_fields(values: TaskFields) -> TaskFields:
+    """derive_overdue pour une projection qui contient le statut."""
+    if "status" in values and is_past_due(values["status"], values["due_date"]):
+        values["status"] = TaskStatus.OVERDUE
+    return values
+
+
+def derive_changes(changes: Optional[list[TaskChange]]) -> Optional[list[TaskChange]]:
+    for change in changes or ():
+        if change.task is not None:
+            derive_overdue(change.task)
+    return changes
+
+
+# =========================
+# Opérations par lot
+# =========================
+# Les erreurs sont retournées par position dans le lot : {index: message}.
+
+def prepare_creates(items: list[dict[str, Any]]) -> tuple[list[Task], dict[int, str]]:
+    tasks: list[Task] = []
+    errors: dict[int, str] = {}
+
+    for index, item in enumerate(items):
+        try:
+            tasks.append(new_task(item.get("title"), item.get("description"), item.get("due_date")))
+        except (ValueError, InvalidTaskTitle) as e:
+            errors[index] = str(e)
+    return tasks, errors
+
+
+def prepare_updates(
+    items: list[dict[str, Any]],
+    existing_tasks: list[Task],
+) -> tuple[list[Task], dict[int, str], list[str], list[tuple[TaskEventType, Task]]]:
+    existing = {task.id: task for task in existing_tasks}
+    tasks: list[Task] = []
+    errors: dict[int, str] = {}
+    messages: list[str] = []
+    events: list[tuple[TaskEventType, Task]] = []
+
+    for index, item in enumerate(items):
+        task = existing.get(item["id"])
+        if task is None:
+            errors[index] = "Task not found"
+            continue
+
+        old_status = task.status
+        try:
+            changed = apply_update(
+                task,
+                item.get("title"),
+                item.get("description"),
+                item.get("status"),
+                # Contrairement à update_task, une échéance absente est conservée
+                item.get("due_date", task.due_date),
+            )
+        except (ValueError, InvalidTaskTitle) as e:
+            errors[index] = str(e)
+            continue
+
+        tasks.append(task)
+        if old_status != task.status:
+            messages.append(
+                f"Tache {task.id} : statut changé de {old_status.value} à {task.status.value}"
+            )
+        elif changed:
+            messages.append(f"Tâche modifiée : {task.title} (id={task.id})")
+        if changed:
+            events.append((update_event(old_status, task), task))
+    return tasks, errors, messages, events
+
+
+def missing_errors(task_ids: list[int], existing: dict[int, Task]) -> dict[int, str]:
+    return {
+        index: "Task not found"
+        for index, task_id in enumerate(task_ids)
+        if task_id not in existing
+    }
+
+
+def deletion_messages(existing: dict[int, Task], deleted: list[int]) -> list[str]:
+    return [f"Tâche supprimée : {existing[task_id].title} (id={task_id})" for task_id in deleted]
+
+
+# =========================
+# Diffusion des changements
+# =========================
+# Le publisher est optionnel : la TUI n'en a pas, l'API diffuse aux abonnés SSE / WebSocket.
+
+def publish(publisher: Optional[EventPublisher], event_type: TaskEventType, task: Task) -> None:
+    if publisher is not None:
+        publisher.publish(event_type, task.id, task)
+
+
+def publish_deleted(publisher: Optional[EventPublisher], task_ids: list[int]) -> None:
+    if publisher is not None:
+        for task_id in task_ids:
+            publisher.publish(TaskEventType.DELETED, task_id)
+
+
+def update_event(old_status: TaskStatus, task: Task) -> TaskEventType:
+    return TaskEventType.STATUS_CHANGED if old_status != task.status else TaskEventType.UPDATED
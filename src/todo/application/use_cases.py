@@ -1,8 +1,24 @@
-from typing import Optional
-from datetime import date
+from typing import Any, Collection, Iterator, Optional
+from datetime import date, datetime, timedelta, timezone
 
 from todo.domain.task import Task, TaskStatus
-from todo.application.ports import TaskRepository, Notifier
+from todo.application.ports import EventPublisher, TaskChange, TaskEventType, TaskFields, TaskRepository, Notifier
+from todo.application.task_rules import (
+    new_task,
+    apply_update,
+    apply_status,
+    with_overdue_inputs,
+    derive_overdue,
+    derive_overdue_fields,
+    derive_changes,
+    prepare_creates,
+    prepare_updates,
+    missing_errors,
+    deletion_messages,
+    publish,
+    publish_deleted,
+    update_event,
+)
 
 
 # =========================
@@ -15,19 +31,12 @@ def create_task(
     title: str,
     description: Optional[str] = None,
     due_date: Optional[date] = None,
+    publisher: Optional[EventPublisher] = None,
 ) -> Task:
-    if not title or len(title) > 30:
-        raise ValueError("Title is required and must be 1-30 characters long.")
-    if description is not None and len(description) > 115:
-        raise ValueError("Description must not exceed 115 characters.")
-    task = Task(
-        id=0, # Def par la BDD en auto increment
-        title=title,
-        description=description,
-        due_date=due_date,
-    )
+    task = new_task(title, description, due_date)
     repository.add(task)
     notifier.notify(f"Tâche créée : {task.title} (id={task.id})")
+    publish(publisher, TaskEventType.CREATED, task)
     return task
 
 
@@ -35,13 +44,19 @@ def create_task(
 # Suppression d'une tache
 # =========================
 
-def delete_task(repository: TaskRepository, notifier: Notifier, task_id: int) -> bool:
+def delete_task(
+    repository: TaskRepository,
+    notifier: Notifier,
+    task_id: int,
+    publisher: Optional[EventPublisher] = None,
+) -> bool:
     task = repository.get(task_id)
     if task is None:
         return False
 
     repository.delete(task_id)
     notifier.notify(f"Tâche supprimée : {task.title} (id={task.id})")
+    publish_deleted(publisher, [task_id])
     return True
 
 
@@ -50,25 +65,114 @@ def delete_task(repository: TaskRepository, notifier: Notifier, task_id: int) ->
 # =========================
 
 def get_task(repository: TaskRepository, task_id: int) -> Optional[Task]:
+    """Lecture pure : une requête, aucune écriture (retard dérivé, voir derive_overdue)."""
     task = repository.get(task_id)
-    if task is not None:
-        update_overdue_tasks(repository, [task])
-    return repository.get(task_id)
+    return derive_overdue(task) if task is not None else None
+
+
+def get_task_fields(
+    repository: TaskRepository, task_id: int, fields: Collection[str]
+) -> Optional[TaskFields]:
+    """get_task réduit aux `fields` (projection ?fields=), avec le même retard dérivé."""
+    values = repository.get_fields(task_id, with_overdue_inputs(fields))
+    return derive_overdue_fields(values) if values is not None else None
+
+
+def list_tasks(
+    repository: TaskRepository,
+    status: Optional[TaskStatus] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
+    sweep: bool = True,
+) -> list[Task]:
+    # sweep=False : l'appelant a déjà fait le balayage (une seule transaction d'écriture)
+    if sweep:
+        update_overdue_tasks(repository)
+    return repository.list(
+        status=status,
+        due_from=due_from,
+        due_to=due_to,
+        limit=limit,
+        after_id=after_id,
+    )
+
+def list_task_fields(
+    repository: TaskRepository,
+    fields: Collection[str],
+    status: Optional[TaskStatus] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+    limit: Optional[int] = None,
+    after_id: Optional[int] = None,
+    sweep: bool = True,
+) -> list[TaskFields]:
+    """list_tasks réduit aux `fields` (projection ?fields=)."""
+    if sweep:
+        update_overdue_tasks(repository)
+    return repository.list_fields(
+        fields,
+        status=status,
+        due_from=due_from,
+        due_to=due_to,
+        limit=limit,
+        after_id=after_id,
+    )
+
+def export_tasks(
+    repository: TaskRepository,
+    status: Optional[TaskStatus] = None,
+    due_from: Optional[date] = None,
+    due_to: Optional[date] = None,
+) -> Iterator[Task]:
+    update_overdue_tasks(repository)
+    return repository.stream(status=status, due_from=due_from, due_to=due_to)
+
+
+def page_tasks(
+    repository: TaskRepository,
+    limit: int,
+    after_id: Optional[int] = None,
+    before_id: Optional[int] = None,
+) -> list[Task]:
+    """Une page de tâches autour d'un curseur, sans balayage des retards (lecture seule)."""
+    tasks = repository.list(limit=limit, after_id=after_id, before_id=before_id)
+    return [derive_overdue(task) for task in tasks]
+
+
+def search_tasks(repository: TaskRepository, query: str, limit: int = 50) -> list[Task]:
+    """Recherche plein texte, en lecture seule comme get_task."""
+    return [derive_overdue(task) for task in repository.search(query, limit)]
+
+
+def get_data_version(repository: TaskRepository) -> int:
+    return repository.data_version()
+
+
+def count_tasks_by_status(repository: TaskRepository) -> dict[TaskStatus, int]:
+    return repository.count_by_status(date.today())
+
+
+# =========================
+# Synchronisation incrémentale
+# =========================
+
+def list_changes(repository: TaskRepository, since: int, limit: int = 1000) -> Optional[list[TaskChange]]:
+    """Changements après le numéro `since` ; None si le client doit tout recharger."""
+    return derive_changes(repository.changes_since(since, limit))
+
 
-def list_tasks(repository: TaskRepository) -> list[Task]:
-    tasks = repository.list()
-    update_overdue_tasks(repository, tasks)
-    return tasks
+def compact_changes(repository: TaskRepository, retention: timedelta) -> int:
+    """Oublie les suppressions plus anciennes que `retention`."""
+    return repository.compact_changes(datetime.now(timezone.utc) - retention)
 
 
 # =========================
 # Mise à jour des teches en retard
 # =========================
-def update_overdue_tasks(repository: TaskRepository, tasks: list[Task]) -> None:
-    for task in tasks:
-        if (task.is_overdue()):
-            task.status = TaskStatus.OVERDUE
-            repository.update(task)
+def update_overdue_tasks(repository: TaskRepository) -> list[int]:
+    return repository.mark_overdue_before(date.today())
 
 
 # =========================
@@ -82,38 +186,21 @@ def update_task(
     description: Optional[str] = None,
     status: Optional[str] = None,
     due_date: Optional[date] = None,
+    publisher: Optional[EventPublisher] = None,
 ) -> Optional[Task]:
     task = repository.get(task_id)
     if task is None:
         return None
 
-    before = (task.title, task.description, task.status, task.due_date)
-
-    if title is not None:
-        if not title or len(title) > 30:
-            raise ValueError("Title is required and must be 1-30 characters long.")
-        task.title = title
-    if description is not None:
-        if len(description) > 115:
-            raise ValueError("Description must not exceed 115 characters.")
-        task.description = description
-    if status is not None:
-        task.status = TaskStatus(status)
-        if task.status == TaskStatus.IN_PROGRESS:
-            update_overdue_tasks(repository, [task])
-    if due_date is not None:
-        task.due_date = due_date
-        if (task.status == TaskStatus.OVERDUE and due_date >= date.today()):
-            task.status = TaskStatus.IN_PROGRESS
-    else:
-        task.due_date = None
-
+    old_status = task.status
+    changed = apply_update(task, title, description, status, due_date)
     updated = repository.update(task)
-    after = (task.title, task.description, task.status, task.due_date)
-    if before != after:
+    if changed:
         notifier.notify(f"Tâche modifiée : {task.title} (id={task.id})")
+        publish(publisher, update_event(old_status, task), task)
     return updated
 
+
 # =========================
 # Changement de statut
 # =========================
@@ -123,25 +210,71 @@ def change_task_status(
     notifier: Notifier,
     task_id: int,
     new_status: TaskStatus,
+    publisher: Optional[EventPublisher] = None,
 ) -> Optional[Task]:
     task = repository.get(task_id)
     if task is None:
         return None
 
-    old_status = task.status
+    message = apply_status(task, new_status)
+    if message is not None:
+        notifier.notify(message)
 
-    if new_status == TaskStatus.DONE:
-        task.mark_done()
-    elif new_status == TaskStatus.IN_PROGRESS:
-        task.mark_in_progress()
+    repository.update(task)
+    if message is not None:
+        publish(publisher, TaskEventType.STATUS_CHANGED, task)
+    return task
 
-    if task.is_overdue():
-        task.mark_overdue()
 
-    if old_status != task.status:
-        notifier.notify(
-            f"Tache {task.id} : statut changé de {old_status.value} à {task.status.value}"
-        )
+# =========================
+# Opérations par lot
+# =========================
+# Chaque lot est écrit en une seule transaction et notifié en une seule écriture.
+# Les erreurs sont retournées par position dans le lot : {index: message}.
+
+def create_tasks(
+    repository: TaskRepository,
+    notifier: Notifier,
+    items: list[dict[str, Any]],
+    publisher: Optional[EventPublisher] = None,
+) -> tuple[list[Task], dict[int, str]]:
+    tasks, errors = prepare_creates(items)
+    if tasks:
+        repository.add_many(tasks)
+        notifier.notify_many([f"Tâche créée : {task.title} (id={task.id})" for task in tasks])
+        for task in tasks:
+            publish(publisher, TaskEventType.CREATED, task)
+    return tasks, errors
+
+
+def update_tasks(
+    repository: TaskRepository,
+    notifier: Notifier,
+    items: list[dict[str, Any]],
+    publisher: Optional[EventPublisher] = None,
+) -> tuple[list[Task], dict[int, str]]:
+    existing = repository.get_many([item["id"] for item in items])
+    tasks, errors, messages, events = prepare_updates(items, existing)
+    if tasks:
+        repository.update_many(tasks)
+    if messages:
+        notifier.notify_many(messages)
+    for event_type, task in events:
+        publish(publisher, event_type, task)
+    return tasks, errors
+
+
+def delete_tasks(
+    repository: TaskRepository,
+    notifier: Notifier,
+    task_ids: list[int],
+    publisher: Optional[EventPublisher] = None,
+) -> tuple[list[int], dict[int, str]]:
+    existing = {task.id: task for task in repository.get_many(task_ids)}
+    deleted = repository.delete_many(list(existing))
+    if deleted:
+        notifier.notify_many(deletion_messages(existing, deleted))
+        publish_deleted(publisher, deleted)
+    return deleted, missing_errors(task_ids, existing)
+
 
-    repository.update(task)
-    return task
@@ -26,11 +26,25 @@ class TaskStatus(str, Enum):
     OVERDUE = "overdue"
 
 
+def is_past_due(status: TaskStatus, due_date: date | None) -> bool:
+    """Règle du retard : tâche en cours dont l'échéance est passée."""
+    if due_date is None:
+        return False
+
+    if status != TaskStatus.IN_PROGRESS:
+        return False
+
+    return due_date < date.today()
+
+
 # =========================
 # Entité Task
 # =========================
 
 class Task:
+    # Pas de __dict__ par instance : moins de mémoire pour les grosses listes
+    __slots__ = ("id", "title", "description", "status", "due_date")
+
     def __init__(
         self,
         id: int,
@@ -51,6 +65,27 @@ class Task:
         self.status = status
         self.due_date = due_date
 
+    @classmethod
+    def from_row(
+        cls,
+        id: int,
+        title: str,
+        description: str | None,
+        status: str,
+        due_date: date | None,
+    ) -> "Task":
+        """
+        Reconstruit une tâche déjà validée à l'écriture (lue en base), sans
+        repasser par les contrôles de __init__. Réservé à la persistance.
+        """
+        task = cls.__new__(cls)
+        task.id = id
+        task.title = title
+        task.description = description
+        task.status = TaskStatus(status)
+        task.due_date = due_date
+        return task
+
     def mark_done(self) -> None:
         """Marque la tâche comme terminée."""
         self.status = TaskStatus.DONE
@@ -65,10 +100,4 @@ class Task:
 
     def is_overdue(self) -> bool:
         """Retourne True si la tâche est en retard."""
-        if self.due_date is None:
-            return False
-
-        if self.status != TaskStatus.IN_PROGRESS:
-            return False
-
-        return self.due_date < date.today()
+        return is_past_due(self.status, self.due_date)
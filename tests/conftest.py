@@ -0,0 +1,34 @@
+import pytest
+from fastapi.testclient import TestClient
+
+from todo.adapters.api import api
+from todo.adapters.api.cache import ResponseCache
+from todo.adapters.api.events import EventBroker
+from todo.adapters.api.serialization import dump_event
+from todo.adapters.notifications.notif import Notif
+from todo.adapters.persistence.sqlite_async_repository import AsyncSQLiteTaskRepository
+
+HEADERS = {"X-API-Key": "test"}
+
+
+# =========================
+# Client API sur une base temporaire
+# =========================
+
+@pytest.fixture
+def client(tmp_path, monkeypatch):
+    monkeypatch.setattr(api, "API_KEY", "test")
+    repository = AsyncSQLiteTaskRepository(f"sqlite:///{tmp_path / 'todo.db'}")
+    notifier = Notif(str(tmp_path / "notifications.txt"))
+    cache = ResponseCache()
+    broker = EventBroker(dump_event)
+    api.app.dependency_overrides[api.get_repository] = lambda: repository
+    api.app.dependency_overrides[api.get_notifier] = lambda: notifier
+    api.app.dependency_overrides[api.get_response_cache] = lambda: cache
+    api.app.dependency_overrides[api.get_event_broker] = lambda: broker
+
+    with TestClient(api.app) as client:
+        yield client
+        client.portal.call(repository.close)
+
+    api.app.dependency_overrides.clear()
@@ -0,0 +1,33 @@
+from todo.adapters.api.api import BATCH_MAX_ITEMS
+from tests.conftest import HEADERS
+
+
+# =========================
+# Tests
+# =========================
+
+def test_batch_size_is_limited(client):
+    """Test : un lot trop grand est refusé (422) avant d'atteindre SQLite"""
+    too_many = BATCH_MAX_ITEMS + 1
+
+    created = client.post("/tasks:batch", json=[{"title": "T"}] * too_many, headers=HEADERS)
+    updated = client.patch("/tasks:batch", json=[{"id": 1}] * too_many, headers=HEADERS)
+    deleted = client.request("DELETE", "/tasks:batch", json={"ids": list(range(too_many))}, headers=HEADERS)
+
+    assert [r.status_code for r in (created, updated, deleted)] == [422, 422, 422]
+
+
+def test_batch_patch_keeps_omitted_due_date(client):
+    """Test : PATCH par lot sans due_date garde l'échéance, due_date: null l'efface"""
+    ids = [
+        client.post("/tasks", json={"title": title, "due_date": "2099-01-01"}, headers=HEADERS).json()["id"]
+        for title in ("Un", "Deux")
+    ]
+
+    response = client.patch(
+        "/tasks:batch",
+        json=[{"id": ids[0], "title": "Un bis"}, {"id": ids[1], "due_date": None}],
+        headers=HEADERS,
+    )
+
+    assert [t["due_date"] for t in response.json()["items"]] == ["2099-01-01", None]
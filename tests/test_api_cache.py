@@ -0,0 +1,92 @@
+from datetime import date, timedelta
+
+from todo.adapters.api import api
+from todo.domain.task import Task
+from todo.adapters.api.cache import ResponseCache
+from tests.conftest import HEADERS
+
+
+# =========================
+# Tests
+# =========================
+
+def test_lru_eviction_and_body_limit():
+    """Test : l'entrée la moins récemment lue sort, les gros corps ne sont pas gardés"""
+    cache = ResponseCache(maxsize=2, max_body_bytes=10)
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    cache.get("a")
+    cache.put("c", b"3")
+    big = cache.put("d", b"x" * 11)
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None and cache.get("c") is not None
+    assert cache.get("d") is None and big.etag
+
+
+def test_list_etag_roundtrip(client):
+    """Test : 304 tant que rien ne change, 200 avec un nouvel ETag après une écriture"""
+    client.post("/tasks", json={"title": "Première"}, headers=HEADERS)
+
+    first = client.get("/tasks", headers=HEADERS)
+    etag = first.headers["ETag"]
+    unchanged = client.get("/tasks", headers={**HEADERS, "If-None-Match": etag})
+
+    client.post("/tasks", json={"title": "Deuxième"}, headers=HEADERS)
+    changed = client.get("/tasks", headers={**HEADERS, "If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert unchanged.status_code == 304 and unchanged.content == b""
+    assert changed.status_code == 200
+    assert changed.headers["ETag"] != etag
+    assert [t["title"] for t in changed.json()] == ["Première", "Deuxième"]
+
+
+def test_get_task_etag_and_cursor_header(client):
+    """Test : ETag sur GET /tasks/{id}, X-Next-Cursor conservé par le cache"""
+    for title in ("A", "B"):
+        client.post("/tasks", json={"title": title}, headers=HEADERS)
+
+    task = client.get("/tasks/1", headers=HEADERS)
+    again = client.get("/tasks/1", headers={**HEADERS, "If-None-Match": task.headers['ETag'].removeprefix("W/")})
+    page = client.get("/tasks?limit=1", headers=HEADERS)
+    cached_page = client.get("/tasks?limit=1", headers=HEADERS)
+
+    assert task.json()["title"] == "A"
+    assert again.status_code == 304
+    assert page.headers["X-Next-Cursor"] == cached_page.headers["X-Next-Cursor"] == "1"
+    assert client.get("/tasks/99", headers=HEADERS).status_code == 404
+
+
+def test_list_cached_under_version_after_overdue_sweep(client):
+    """Test : le balayage des retards ne rend pas l'entrée mise en cache inatteignable"""
+    # Tâche en cours déjà échue en base (écrite hors API, par la TUI la veille)
+    repository = client.app.dependency_overrides[api.get_repository]()
+    yesterday = date.today() - timedelta(days=1)
+    client.portal.call(repository.add, Task(id=0, title="En retard", due_date=yesterday))
+    cache = client.app.dependency_overrides[api.get_response_cache]()
+
+    first = client.get("/tasks", headers=HEADERS)
+    second = client.get("/tasks", headers=HEADERS)
+
+    assert first.json()[0]["status"] == second.json()[0]["status"] == "overdue"
+    assert len(cache) == 1
+    assert first.headers["ETag"].startswith("W/")
+
+
+def test_list_miss_sweeps_once(client, monkeypatch):
+    """Test : une liste hors cache ne fait qu'un balayage des retards (une transaction d'écriture)"""
+    repository = client.app.dependency_overrides[api.get_repository]()
+    sweep = repository.mark_overdue_before
+    calls = []
+
+    async def counted(today):
+        calls.append(today)
+        return await sweep(today)
+
+    monkeypatch.setattr(repository, "mark_overdue_before", counted)
+
+    client.get("/tasks", headers=HEADERS)
+    client.get("/tasks?limit=5", headers=HEADERS)
+
+    assert len(calls) == 2
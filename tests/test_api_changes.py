@@ -0,0 +1,60 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy.exc import OperationalError
+
+from todo.adapters.api import api
+from tests.conftest import HEADERS
+
+
+# =========================
+# Tests synchronisation incrémentale
+# =========================
+
+def test_changes_cursor_and_pagination(client):
+    """Test : le curseur renvoyé sert de prochain `since`, has_more signale la suite"""
+    for title in ("Une", "Deux", "Trois"):
+        client.post("/tasks", json={"title": title}, headers=HEADERS)
+
+    first = client.get("/tasks/changes", params={"limit": 2}, headers=HEADERS).json()
+    rest = client.get("/tasks/changes", params={"since": first["cursor"]}, headers=HEADERS).json()
+
+    assert [c["task"]["title"] for c in first["changes"]] == ["Une", "Deux"]
+    assert first["has_more"] is True
+    assert [c["task"]["title"] for c in rest["changes"]] == ["Trois"]
+    assert rest["has_more"] is False
+
+
+def test_changes_report_deletions_then_gone_after_compaction(client):
+    """Test : une suppression apparaît sans tâche ; 410 une fois compactée"""
+    task_id = client.post("/tasks", json={"title": "Éphémère"}, headers=HEADERS).json()["id"]
+    cursor = client.get("/tasks/changes", headers=HEADERS).json()["cursor"]
+    client.delete(f"/tasks/{task_id}", headers=HEADERS)
+
+    delta = client.get("/tasks/changes", params={"since": cursor}, headers=HEADERS).json()
+    assert [(c["task_id"], c["op"], c["task"]) for c in delta["changes"]] == [(task_id, "deleted", None)]
+
+    repository = client.app.dependency_overrides[api.get_repository]()
+    client.portal.call(repository.compact_changes, datetime.now(timezone.utc) + timedelta(seconds=1))
+
+    assert client.get("/tasks/changes", params={"since": cursor}, headers=HEADERS).status_code == 410
+    assert client.get("/tasks/changes", params={"since": 0}, headers=HEADERS).json()["changes"] == []
+
+
+def test_periodic_compaction_logs_failures(monkeypatch, caplog):
+    """Test : base occupée -> avertissement et nouvel essai ; autre erreur -> journalisée, boucle arrêtée"""
+    failures = [OperationalError("DELETE", {}, Exception("database is locked")), RuntimeError("no such table")]
+
+    async def failing_compaction(repository, retention):
+        raise failures.pop(0)
+
+    monkeypatch.setattr(api, "compact_changes", failing_compaction)
+    monkeypatch.setattr(api, "CHANGES_COMPACT_INTERVAL", 0)
+    monkeypatch.setitem(api.app.dependency_overrides, api.get_repository, lambda: None)
+
+    with caplog.at_level(logging.WARNING, logger=api.logger.name):
+        asyncio.run(asyncio.wait_for(api.compact_changes_periodically(api.app), timeout=1))
+
+    assert [record.levelname for record in caplog.records] == ["WARNING", "ERROR"]
+    assert failures == []
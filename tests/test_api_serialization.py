@@ -0,0 +1,78 @@
+from datetime import date
+
+from todo.adapters.api.api import TaskOut
+from todo.adapters.api.serialization import dump_task, dump_tasks
+from todo.domain.task import Task, TaskStatus
+from tests.conftest import HEADERS
+
+
+def as_model(task: Task) -> TaskOut:
+    return TaskOut(id=task.id, title=task.title, description=task.description, status=task.status, due_date=task.due_date)
+
+
+# =========================
+# Tests
+# =========================
+
+def test_direct_json_matches_task_out():
+    """Test : même JSON que le modèle TaskOut, champs optionnels vides compris"""
+    tasks = [
+        Task(id=1, title="Échéance", description="Détails", due_date=date(2026, 3, 1)),
+        Task(id=2, title="Sans date", status=TaskStatus.DONE),
+    ]
+
+    assert dump_task(tasks[0]) == as_model(tasks[0]).model_dump_json().encode()
+    assert dump_tasks(tasks) == b"[" + b",".join(as_model(t).model_dump_json().encode() for t in tasks) + b"]"
+
+
+def test_endpoints_keep_status_and_shape(client):
+    """Test : 201 à la création, lots au format {items, errors}"""
+    created = client.post("/tasks", json={"title": "Nouvelle"}, headers=HEADERS)
+    batch = client.post("/tasks:batch", json=[{"title": "A"}, {"title": ""}], headers=HEADERS)
+
+    assert created.status_code == 201
+    assert created.headers["content-type"] == "application/json"
+    assert created.json()["title"] == "Nouvelle"
+    assert [t["title"] for t in batch.json()["items"]] == ["A"]
+    assert [e["index"] for e in batch.json()["errors"]] == [1]
+
+
+def test_fields_projection(client):
+    """Test : ?fields= ne renvoie que les champs demandés (id toujours), 422 si inconnu"""
+    task_id = client.post("/tasks", json={"title": "Projetée", "description": "Longue"}, headers=HEADERS).json()["id"]
+
+    listed = client.get("/tasks", params={"fields": "status,title"}, headers=HEADERS).json()
+    single = client.get(f"/tasks/{task_id}", params={"fields": "due_date"}, headers=HEADERS).json()
+    unknown = client.get("/tasks", params={"fields": "title,secret"}, headers=HEADERS)
+
+    assert listed == [{"id": task_id, "title": "Projetée", "status": "in_progress"}]
+    assert single == {"id": task_id, "due_date": None}
+    assert unknown.status_code == 422
+
+
+def test_large_responses_are_gzipped(client):
+    """Test : compression au-delà du seuil seulement"""
+    client.post("/tasks:batch", json=[{"title": f"Tâche {i}"} for i in range(50)], headers=HEADERS)
+    gzip = {**HEADERS, "Accept-Encoding": "gzip"}
+
+    large = client.get("/tasks", headers=gzip)
+    small = client.get("/tasks", params={"limit": 1}, headers=gzip)
+
+    assert large.headers["content-encoding"] == "gzip"
+    assert len(large.json()) == 50
+    assert "content-encoding" not in small.headers
+
+
+def test_fields_projection_paginates_and_derives_overdue(client):
+    """Test : projection paginée (X-Next-Cursor) et statut en retard dérivé sur GET /tasks/{id}"""
+    ids = [
+        client.post("/tasks", json={"title": f"T{i}", "due_date": "2000-01-01"}, headers=HEADERS).json()["id"]
+        for i in range(2)
+    ]
+
+    page = client.get("/tasks", params={"fields": "title", "limit": 1}, headers=HEADERS)
+    single = client.get(f"/tasks/{ids[1]}", params={"fields": "status"}, headers=HEADERS).json()
+
+    assert page.json() == [{"id": ids[0], "title": "T0"}]
+    assert page.headers["X-Next-Cursor"] == str(ids[0])
+    assert single == {"id": ids[1], "status": "overdue"}
@@ -0,0 +1,90 @@
+import asyncio
+import pytest
+from datetime import date, timedelta
+
+from todo.adapters.persistence.sqlite_async_repository import AsyncSQLiteTaskRepository
+from todo.adapters.persistence.sqlite_repository import SQLiteTaskRepository
+from todo.domain.task import Task, TaskStatus
+
+
+# =========================
+# Base temporaire
+# =========================
+
+@pytest.fixture
+def database_url(tmp_path):
+    return f"sqlite:///{tmp_path / 'todo.db'}"
+
+
+def run(database_url, scenario):
+    """Exécute un scénario sur un repository asynchrone, puis ferme l'engine"""
+    async def main():
+        repository = AsyncSQLiteTaskRepository(database_url)
+        try:
+            return await scenario(repository)
+        finally:
+            await repository.close()
+    return asyncio.run(main())
+
+
+# =========================
+# Tests
+# =========================
+
+def test_async_crud(database_url):
+    """Test : add / get / update / delete en asynchrone"""
+    async def scenario(repository):
+        task = Task(id=0, title="Async")
+        await repository.add(task)
+        task.mark_done()
+        updated = await repository.update(task)
+        fetched = await repository.get(task.id)
+        await repository.delete(task.id)
+        return task, updated, fetched, await repository.get(task.id)
+
+    task, updated, fetched, deleted = run(database_url, scenario)
+
+    assert task.id > 0
+    assert updated.status == TaskStatus.DONE
+    assert fetched.title == "Async"
+    assert deleted is None
+
+
+def test_async_shares_database_with_sync(database_url):
+    """Test : les deux adapters lisent et écrivent la même base"""
+    SQLiteTaskRepository(database_url).add(Task(id=0, title="Depuis la TUI"))
+
+    async def scenario(repository):
+        await repository.add_many([Task(id=0, title="Depuis l'API")])
+        return [t.title async for t in repository.stream(batch_size=1)]
+
+    assert run(database_url, scenario) == ["Depuis la TUI", "Depuis l'API"]
+    assert len(SQLiteTaskRepository(database_url).list()) == 2
+
+
+def test_async_concurrent_requests(database_url):
+    """Test : des requêtes concurrentes sur la même boucle aboutissent toutes"""
+    yesterday = date.today() - timedelta(days=1)
+
+    async def scenario(repository):
+        await repository.add_many([Task(id=0, title=f"T{i}", due_date=yesterday) for i in range(20)])
+        pages = await asyncio.gather(*(repository.list(limit=5, after_id=i * 5) for i in range(4)))
+        overdue = await repository.mark_overdue_before(date.today())
+        return pages, overdue
+
+    pages, overdue = run(database_url, scenario)
+
+    assert [len(page) for page in pages] == [5, 5, 5, 5]
+    assert len(overdue) == 20
+
+
+def test_async_previous_page_and_counts(database_url):
+    """Test : before_id et count_by_status en asynchrone"""
+    async def scenario(repository):
+        await repository.add_many([Task(id=0, title=f"T{i}") for i in range(5)])
+        return await repository.list(limit=2, before_id=4), await repository.count_by_status(date.today())
+
+    page, counts = run(database_url, scenario)
+
+    assert [t.id for t in page] == [2, 3]
+    assert counts[TaskStatus.IN_PROGRESS] == 5
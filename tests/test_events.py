@@ -0,0 +1,121 @@
+import asyncio
+import pytest
+from unittest.mock import Mock
+
+from fastapi import WebSocketDisconnect
+
+from todo.adapters.api.events import EventBroker
+from todo.application.ports import TaskEventType
+from todo.application.use_cases import change_task_status, delete_tasks
+from todo.domain.task import Task, TaskStatus
+from tests.conftest import HEADERS
+
+
+def _broker(buffer_size: int = 1000) -> EventBroker:
+    return EventBroker(lambda event_type, task_id, task: f'{{"task_id":{task_id}}}', buffer_size)
+
+
+def _run(coro):
+    return asyncio.run(coro)
+
+
+# =========================
+# Broker
+# =========================
+
+def test_replay_after_last_event_id():
+    """Test : un client qui se reconnecte ne reçoit que les événements manqués"""
+    async def scenario():
+        broker = _broker()
+        for task_id in (1, 2, 3):
+            broker.publish(TaskEventType.CREATED, task_id)
+        subscription = broker.subscribe(f"{broker.epoch}-1")
+        return subscription
+
+    subscription = _run(scenario())
+
+    assert not subscription.reset
+    assert [event.seq for event in subscription.missed] == [2, 3]
+
+
+def test_reset_when_token_cannot_be_replayed():
+    """Test : autre démarrage ou tampon dépassé -> le client doit tout recharger"""
+    async def scenario():
+        broker = _broker(buffer_size=2)
+        for task_id in (1, 2, 3, 4):
+            broker.publish(TaskEventType.CREATED, task_id)
+        return (
+            broker.subscribe("autre-1"),
+            broker.subscribe(f"{broker.epoch}-1"),
+            broker.subscribe(f"{broker.epoch}-2"),
+        )
+
+    other_epoch, overflowed, buffered = _run(scenario())
+
+    assert other_epoch.reset and overflowed.reset
+    assert not buffered.reset
+    assert [event.seq for event in buffered.missed] == [3, 4]
+
+
+def test_slow_subscriber_is_disconnected():
+    """Test : une file pleine coupe l'abonné au lieu de bloquer les écritures"""
+    async def scenario():
+        broker = EventBroker(lambda *args: "{}", queue_size=1)
+        subscription = broker.subscribe()
+        broker.publish(TaskEventType.CREATED, 1)
+        broker.publish(TaskEventType.CREATED, 2)
+        return subscription
+
+    subscription = _run(scenario())
+
+    assert subscription.queue.get_nowait() is None
+
+
+# =========================
+# Use cases
+# =========================
+
+def test_change_task_status_publishes_event():
+    """Test : un changement de statut publie un événement status_changed"""
+    repository, notifier, publisher = Mock(), Mock(), Mock()
+    task = Task(id=1, title="Test", status=TaskStatus.IN_PROGRESS)
+    repository.get.return_value = task
+
+    change_task_status(repository, notifier, 1, TaskStatus.DONE, publisher=publisher)
+
+    publisher.publish.assert_called_once_with(TaskEventType.STATUS_CHANGED, 1, task)
+
+
+def test_delete_tasks_publishes_only_deleted_ids():
+    """Test : seules les tâches réellement supprimées sont publiées"""
+    repository, notifier, publisher = Mock(), Mock(), Mock()
+    repository.get_many.return_value = [Task(id=1, title="Test")]
+    repository.delete_many.return_value = [1]
+
+    delete_tasks(repository, notifier, [1, 2], publisher=publisher)
+
+    publisher.publish.assert_called_once_with(TaskEventType.DELETED, 1)
+
+
+# =========================
+# WebSocket
+# =========================
+
+def test_websocket_receives_created_task(client):
+    """Test : une création via l'API arrive sur le WebSocket avec son jeton de reprise"""
+    with client.websocket_connect("/tasks/events/ws?api_key=test") as websocket:
+        client.post("/tasks", json={"title": "Nouvelle"}, headers=HEADERS)
+        message = websocket.receive_json()
+
+    assert message["type"] == "created"
+    assert message["id"].endswith("-1")
+    assert message["data"]["task"]["title"] == "Nouvelle"
+
+
+def test_websocket_rejects_missing_api_key(client):
+    """Test : sans clé d'API la connexion WebSocket est refusée"""
+    with pytest.raises(WebSocketDisconnect) as exc_info:
+        with client.websocket_connect("/tasks/events/ws"):
+            pass
+
+    assert exc_info.value.code == 1008
@@ -0,0 +1,147 @@
+import gzip
+import os
+import time
+import pytest
+from unittest.mock import patch
+
+from todo.adapters.notifications.notif import BufferedNotifier, Notif, tail_lines
+
+
+def read_lines(path):
+    return path.read_text(encoding="utf-8").splitlines()
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+# =========================
+# Tests Notif
+# =========================
+
+def test_notify_many_single_write(tmp_path):
+    """Test : un lot de messages = une seule ouverture du fichier"""
+    path = tmp_path / "notifications.txt"
+    notif = Notif(str(path))
+
+    with patch("builtins.open", wraps=open) as mocked_open:
+        notif.notify_many(["un", "deux", "trois"])
+
+    assert mocked_open.call_count == 1
+    assert [line.split("] ", 1)[1] for line in read_lines(path)] == ["un", "deux", "trois"]
+
+
+# =========================
+# Tests rotation
+# =========================
+
+def test_rotation_by_size_keeps_backup_count(tmp_path):
+    """Test : rotation par taille, segments compressés, rétention limitée"""
+    path = tmp_path / "notifications.txt"
+    notif = Notif(str(path), max_bytes=200, backup_count=2, compress=True)
+
+    for i in range(40):
+        notif.notify(f"message {i:02d}")
+
+    assert path.stat().st_size <= 200
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "notifications.txt",
+        "notifications.txt.1.gz",
+        "notifications.txt.2.gz",
+    ]
+    newest_archive = gzip.decompress((tmp_path / "notifications.txt.1.gz").read_bytes()).decode()
+    last_archived = int(newest_archive.splitlines()[-1].rsplit(" ", 1)[1])
+    first_current = int(read_lines(path)[0].rsplit(" ", 1)[1])
+    assert first_current == last_archived + 1
+
+
+def test_rotation_daily(tmp_path):
+    """Test : rotation au premier message d'un nouveau jour"""
+    path = tmp_path / "notifications.txt"
+    notif = Notif(str(path), max_bytes=0, daily=True, compress=False)
+    notif.notify("hier")
+    yesterday = time.time() - 86400
+    os.utime(path, (yesterday, yesterday))
+
+    notif.notify("aujourd'hui")
+
+    assert read_lines(path)[0].endswith("aujourd'hui")
+    assert (tmp_path / "notifications.txt.1").read_text(encoding="utf-8").rstrip().endswith("hier")
+
+
+# =========================
+# Tests tail_lines
+# =========================
+
+def test_tail_lines_reads_only_the_end(tmp_path):
+    """Test : les N dernières lignes, même réparties sur plusieurs blocs"""
+    path = tmp_path / "notifications.txt"
+    path.write_text("".join(f"ligne {i} é\n" for i in range(1000)), encoding="utf-8")
+
+    lines, offset = tail_lines(str(path), 3, block_size=16)
+
+    assert lines == ["ligne 997 é", "ligne 998 é", "ligne 999 é"]
+    assert offset == path.stat().st_size
+
+
+def test_tail_lines_short_file(tmp_path):
+    """Test : fichier plus court que N lignes"""
+    path = tmp_path / "notifications.txt"
+    path.write_text("a\nb\n", encoding="utf-8")
+
+    assert tail_lines(str(path), 10) == (["a", "b"], 4)
+
+
+# =========================
+# Tests BufferedNotifier
+# =========================
+
+@pytest.fixture
+def buffered(tmp_path):
+    notifier = BufferedNotifier(str(tmp_path / "notifications.txt"), max_batch=5, flush_interval=60)
+    yield notifier
+    notifier.close()
+
+
+def test_buffered_notify_does_not_write(buffered, tmp_path):
+    """Test : notify ne fait aucune écriture dans le chemin appelant"""
+    buffered.notify("en attente")
+
+    assert not (tmp_path / "notifications.txt").exists()
+
+
+def test_buffered_flushes_on_batch_size(buffered, tmp_path):
+    """Test : le lot est écrit dès max_batch messages"""
+    path = tmp_path / "notifications.txt"
+    for i in range(5):
+        buffered.notify(f"message {i}")
+
+    assert wait_for(lambda: path.exists() and len(read_lines(path)) == 5)
+
+
+def test_buffered_flushes_on_interval(tmp_path):
+    """Test : un message isolé est écrit après flush_interval"""
+    path = tmp_path / "notifications.txt"
+    notifier = BufferedNotifier(str(path), max_batch=100, flush_interval=0.05)
+    try:
+        notifier.notify("seul")
+        # Le fichier peut exister avant que la ligne n'y soit écrite
+        assert wait_for(lambda: path.exists() and any(line.endswith("seul") for line in read_lines(path)[-1:]))
+    finally:
+        notifier.close()
+
+
+def test_buffered_close_flushes_in_order(buffered, tmp_path):
+    """Test : close() écrit tout ce qui reste, dans l'ordre"""
+    messages = [f"message {i}" for i in range(12)]
+    for message in messages:
+        buffered.notify(message)
+
+    buffered.close()
+
+    assert [line.split("] ", 1)[1] for line in read_lines(tmp_path / "notifications.txt")] == messages
@@ -0,0 +1,244 @@
+import pytest
+from datetime import date, datetime, timedelta, timezone
+from sqlalchemy import inspect
+
+from todo.adapters.persistence.sqlite_repository import (
+    SQLiteTaskRepository,
+    get_engine,
+    init_schema,
+    list_query,
+    projection_columns,
+)
+from todo.domain.task import Task, TaskStatus
+
+
+# =========================
+# Base temporaire
+# =========================
+
+@pytest.fixture
+def database_url(tmp_path):
+    return f"sqlite:///{tmp_path / 'todo.db'}"
+
+
+@pytest.fixture
+def repository(database_url):
+    """Repository sur une base SQLite jetable"""
+    return SQLiteTaskRepository(database_url)
+
+
+def seed(repository, count, **kwargs):
+    tasks = [Task(id=0, title=f"Tâche {i}", **kwargs) for i in range(count)]
+    repository.add_many(tasks)
+    return tasks
+
+
+# =========================
+# Tests schéma / configuration
+# =========================
+
+def test_schema_has_listing_indexes(repository, database_url):
+    """Test : les index de filtrage existent"""
+    repository.list()
+
+    indexes = {ix["name"] for ix in inspect(get_engine(database_url)).get_indexes("tasks")}
+    assert {"ix_tasks_status", "ix_tasks_due_date", "ix_tasks_status_due_date"} <= indexes
+
+
+def test_wal_profile_applied(repository, database_url):
+    """Test : le profil par défaut active WAL et synchronous=NORMAL"""
+    with get_engine(database_url).connect() as conn:
+        assert conn.exec_driver_sql("PRAGMA journal_mode").scalar() == "wal"
+        assert conn.exec_driver_sql("PRAGMA synchronous").scalar() == 1
+
+
+# =========================
+# Tests CRUD
+# =========================
+
+def test_add_sets_id(repository):
+    """Test : add renseigne l'id généré"""
+    task = Task(id=0, title="Test")
+    repository.add(task)
+
+    assert task.id > 0
+    assert repository.get(task.id).title == "Test"
+
+
+def test_mark_overdue_before(repository):
+    """Test : seules les tâches en cours échues passent en OVERDUE"""
+    yesterday = date.today() - timedelta(days=1)
+    late = Task(id=0, title="En retard", due_date=yesterday)
+    done = Task(id=0, title="Terminée", status=TaskStatus.DONE, due_date=yesterday)
+    future = Task(id=0, title="À venir", due_date=date.today())
+    repository.add_many([late, done, future])
+
+    assert repository.mark_overdue_before(date.today()) == [late.id]
+    assert repository.get(late.id).status == TaskStatus.OVERDUE
+    assert repository.get(done.id).status == TaskStatus.DONE
+    assert repository.mark_overdue_before(date.today()) == []
+
+
+# =========================
+# Tests listing
+# =========================
+
+def test_list_keyset_pagination(repository):
+    """Test : after_id + limit parcourt toutes les tâches sans doublon"""
+    tasks = seed(repository, 25)
+
+    seen = []
+    after_id = None
+    while True:
+        page = repository.list(limit=10, after_id=after_id)
+        if not page:
+            break
+        seen += [t.id for t in page]
+        after_id = page[-1].id
+
+    assert seen == [t.id for t in tasks]
+
+
+def test_list_before_id_returns_previous_page_in_order(repository):
+    """Test : before_id renvoie les tâches juste avant le curseur, triées par id"""
+    tasks = seed(repository, 25)
+
+    page = repository.list(limit=10, before_id=tasks[20].id)
+
+    assert [t.id for t in page] == [t.id for t in tasks[10:20]]
+
+
+def test_count_by_status(repository):
+    """Test : comptage GROUP BY, les tâches en cours échues comptent en retard"""
+    yesterday = date.today() - timedelta(days=1)
+    seed(repository, 3)
+    seed(repository, 2, status=TaskStatus.DONE, due_date=yesterday)
+    seed(repository, 1, due_date=yesterday)
+
+    assert repository.count_by_status(date.today()) == {
+        TaskStatus.IN_PROGRESS: 3,
+        TaskStatus.DONE: 2,
+        TaskStatus.OVERDUE: 1,
+    }
+
+
+def test_list_filters(repository):
+    """Test : filtres statut et plage d'échéance"""
+    today = date.today()
+    seed(repository, 3, due_date=today)
+    seed(repository, 2, status=TaskStatus.DONE, due_date=today + timedelta(days=10))
+
+    assert len(repository.list(status=TaskStatus.DONE)) == 2
+    assert len(repository.list(due_to=today)) == 3
+    assert len(repository.list(status=TaskStatus.DONE, due_from=today, due_to=today)) == 0
+
+
+def test_stream_yields_all_in_order(repository):
+    """Test : stream parcourt toute la table, triée par id"""
+    tasks = seed(repository, 30)
+
+    assert [t.id for t in repository.stream(batch_size=7)] == [t.id for t in tasks]
+
+
+# =========================
+# Tests opérations par lot
+# =========================
+
+def test_batch_roundtrip(repository):
+    """Test : add_many / update_many / delete_many"""
+    tasks = seed(repository, 3)
+    assert len({t.id for t in tasks}) == 3
+
+    for task in tasks:
+        task.mark_done()
+    repository.update_many(tasks)
+    assert all(t.status == TaskStatus.DONE for t in repository.get_many([t.id for t in tasks]))
+
+    assert repository.delete_many([tasks[0].id, 999]) == [tasks[0].id]
+    assert [t.id for t in repository.list()] == [t.id for t in tasks[1:]]
+
+
+# =========================
+# Tests recherche plein texte
+# =========================
+
+def test_search_ranks_and_ignores_accents(repository):
+    """Test : recherche par préfixe, sans accents, la plus pertinente d'abord"""
+    repository.add_many([
+        Task(id=0, title="Courses", description="Penser au budget de la réunion"),
+        Task(id=0, title="Réunion budget", description="Budget annuel"),
+        Task(id=0, title="Sport"),
+    ])
+
+    results = repository.search("reunion budg")
+
+    assert [t.title for t in results] == ["Réunion budget", "Courses"]
+    assert repository.search("   ") == []
+    assert repository.search('"(') == []
+
+
+def test_search_index_follows_updates_and_deletes(repository):
+    """Test : les triggers tiennent l'index à jour"""
+    task = Task(id=0, title="Ancien titre")
+    repository.add(task)
+
+    task.title = "Nouveau titre"
+    repository.update(task)
+    assert repository.search("ancien") == []
+    assert [t.id for t in repository.search("nouveau")] == [task.id]
+
+    repository.delete(task.id)
+    assert repository.search("nouveau") == []
+
+
+# =========================
+# Tests journal de synchronisation
+# =========================
+
+def test_changes_keep_last_operation_per_task(repository):
+    """Test : une ligne par tâche, avec la dernière opération et l'état actuel"""
+    kept, removed = seed(repository, 2)
+    kept.title = "Modifiée"
+    repository.update(kept)
+    repository.delete(removed.id)
+
+    changes = repository.changes_since(0)
+
+    assert [(c.task_id, c.op.value) for c in changes] == [(kept.id, "updated"), (removed.id, "deleted")]
+    assert changes[0].task.title == "Modifiée" and changes[1].task is None
+    assert repository.changes_since(changes[0].seq) == changes[1:]
+
+
+def test_compaction_expires_old_cursors(repository):
+    """Test : après compactage des suppressions, un ancien curseur reçoit None"""
+    first, second = seed(repository, 2)
+    cursor = repository.changes_since(0)[-1].seq
+    repository.delete(first.id)
+
+    assert repository.compact_changes(datetime.now(timezone.utc) + timedelta(seconds=1)) == 1
+
+    assert repository.changes_since(cursor) is None
+    assert [c.task_id for c in repository.changes_since(0)] == [second.id]
+
+
+def test_changes_seeded_for_existing_tasks(database_url):
+    """Test : une base antérieure au journal y inscrit ses tâches existantes"""
+    repository = SQLiteTaskRepository(database_url)
+    seed(repository, 3)
+    with get_engine(database_url).begin() as conn:
+        conn.exec_driver_sql("DROP TABLE task_changes")
+        init_schema(conn)
+
+    assert len(repository.changes_since(0)) == 3
+
+
+def test_projection_loads_only_requested_columns(repository):
+    """Test : ?fields= se traduit en SELECT réduit, rendu en dict et non en Task partielle"""
+    task, = seed(repository, 1, description="Détail")
+
+    listed = repository.list_fields({"title"})
+    single = repository.get_fields(task.id, {"status"})
+
+    assert listed == [{"id": task.id, "title": "Tâche 0"}]
+    assert single == {"id": task.id, "status": TaskStatus.IN_PROGRESS}
+    assert "description" not in str(list_query(columns=projection_columns({"title"})))
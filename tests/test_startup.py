@@ -0,0 +1,62 @@
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+
+# Budget volontairement large pour rester stable en CI : on détecte les régressions
+# grossières (import lourd ajouté au démarrage), pas les variations de quelques ms.
+IMPORT_BUDGET_S = 2.0
+
+PROBE = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+print(json.dumps({{"seconds": time.perf_counter() - start, "modules": sorted(sys.modules)}}))
+"""
+
+
+def import_in_subprocess(module: str, home) -> dict:
+    """Importe le module dans un interpréteur neuf, avec un HOME temporaire"""
+    env = {**os.environ, "HOME": str(home), "USERPROFILE": str(home)}
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE.format(module=module)],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    return json.loads(result.stdout)
+
+
+def best_of(module: str, home, runs: int = 3) -> dict:
+    return min((import_in_subprocess(module, home) for _ in range(runs)), key=lambda r: r["seconds"])
+
+
+# =========================
+# Tests démarrage
+# =========================
+
+@pytest.mark.parametrize(
+    "module, forbidden",
+    [
+        ("todo.adapters.tui.app", {"fastapi", "textual_timepiece", "whenever"}),
+        ("todo.adapters.api.api", {"textual", "textual_timepiece", "whenever"}),
+    ],
+)
+def test_import_is_light(tmp_path, module, forbidden):
+    """Test : l'import ne charge que le nécessaire et reste sous le budget"""
+    result = best_of(module, tmp_path)
+
+    assert forbidden.isdisjoint(result["modules"])
+    assert result["seconds"] < IMPORT_BUDGET_S
+
+
+@pytest.mark.parametrize("module", ["todo.adapters.persistence.sqlite_repository", "todo.adapters.tui.app", "todo.adapters.api.api"])
+def test_import_has_no_side_effects(tmp_path, module):
+    """Test : l'import ne crée ni dossier de données ni base"""
+    import_in_subprocess(module, tmp_path)
+
+    assert list(tmp_path.iterdir()) == []
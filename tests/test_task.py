@@ -0,0 +1,36 @@
+import pytest
+from datetime import date, timedelta
+
+from todo.domain.task import InvalidTaskTitle, Task, TaskStatus, is_past_due
+
+
+# =========================
+# Tests entité Task
+# =========================
+
+def test_init_validates_title():
+    """Test : la construction normale valide toujours le titre"""
+    with pytest.raises(InvalidTaskTitle):
+        Task(id=1, title="   ")
+
+
+def test_from_row_skips_validation_and_converts_status():
+    """Test : from_row reconstruit la tâche sans revalider, statut converti en enum"""
+    task = Task.from_row(3, "Titre", None, "done", date(2026, 1, 2))
+
+    assert isinstance(task, Task)
+    assert task.status is TaskStatus.DONE
+    assert (task.id, task.title, task.due_date) == (3, "Titre", date(2026, 1, 2))
+
+    # Aucune validation : c'est à l'écriture qu'elle a eu lieu
+    assert Task.from_row(4, "", None, "in_progress", None).title == ""
+
+
+
+def test_is_past_due_rule():
+    """Test : seule une tâche en cours dont l'échéance est passée est en retard"""
+    yesterday = date.today() - timedelta(days=1)
+
+    assert is_past_due(TaskStatus.IN_PROGRESS, yesterday)
+    assert not is_past_due(TaskStatus.DONE, yesterday)
+    assert not is_past_due(TaskStatus.IN_PROGRESS, None)
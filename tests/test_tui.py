@@ -0,0 +1,69 @@
+import asyncio
+from datetime import date, timedelta
+
+
+from todo.adapters.notifications.notif import Notif
+from todo.adapters.persistence.sqlite_repository import SQLiteTaskRepository
+from todo.adapters.tui import app as app_module
+from todo.adapters.tui.app import TaskApp
+from todo.domain.task import Task, TaskStatus
+
+
+def make_app(tmp_path, virtual: bool = False) -> TaskApp:
+    path = str(tmp_path / "notifications.txt")
+    repository = SQLiteTaskRepository(f"sqlite:///{tmp_path / 'todo.db'}")
+    return TaskApp(repository=repository, notif_path=path, notifier=Notif(path), virtual=virtual)
+
+
+# =========================
+# Tests retard
+# =========================
+
+def test_written_tasks_past_due_show_overdue(tmp_path):
+    """Test : création / modification avec une échéance passée -> ligne, détails et base en retard"""
+    yesterday = date.today() - timedelta(days=1)
+    app = make_app(tmp_path)
+
+    async def scenario():
+        async with app.run_test() as pilot:
+            app.create_task({"title": "Passée", "due_date": yesterday})
+            app.create_task({"title": "À modifier"})
+            edited = max(app._tasks)
+            app.edit_task(edited, 1, {"title": "À modifier", "due_date": yesterday})
+            await pilot.pause()
+            return [app.task_cells(task)[2] for task in app._tasks.values()], app.cached_task(edited).status
+
+    cells, cached_status = asyncio.run(scenario())
+
+    assert cells == ["overdue", "overdue"]
+    assert cached_status == TaskStatus.OVERDUE
+    assert [task.status for task in app.repo.list()] == [TaskStatus.OVERDUE, TaskStatus.OVERDUE]
+
+
+# =========================
+# Tests mode virtuel
+# =========================
+
+def test_window_edges_detected_on_full_pages(tmp_path, monkeypatch):
+    """Test : première / dernière page pleines -> le bord est reconnu sans requête vide de plus"""
+    monkeypatch.setattr(app_module, "PAGE_SIZE", 5)
+    monkeypatch.setattr(app_module, "WINDOW_PAGES", 3)
+    app = make_app(tmp_path, virtual=True)
+    app.repo.add_many([Task(id=0, title=f"Tâche {i}") for i in range(20)])
+
+    async def scenario():
+        async with app.run_test():
+            table = app.query_one("#task_table")
+            edges = [(app._at_start, app._at_end)]
+            table.move_cursor(row=table.row_count - 1)
+            app.load_next_page()
+            edges.append((app._at_start, app._at_end))
+            table.move_cursor(row=0)
+            app.load_previous_page()
+            edges.append((app._at_start, app._at_end))
+            return edges, sorted(app._tasks)
+
+    edges, window = asyncio.run(scenario())
+
+    assert edges == [(True, False), (False, True), (True, False)]
+    assert window == list(range(1, 16))
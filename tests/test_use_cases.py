@@ -1,13 +1,22 @@
+import asyncio
 import pytest
 from datetime import date, timedelta
-from unittest.mock import Mock
+from unittest.mock import AsyncMock, Mock
 
 from todo.application.use_cases import (
     create_task,
     delete_task,
     update_task,
+    get_task,
+    get_task_fields,
+    list_tasks,
+    export_tasks,
     change_task_status,
+    create_tasks,
+    update_tasks,
+    delete_tasks,
 )
+from todo.application import async_use_cases
 from todo.domain.task import Task, TaskStatus
 
 
@@ -122,6 +131,85 @@ def test_delete_task_not_found(mock_repository, mock_notifier):
     mock_notifier.notify.assert_not_called()
 
 
+# =========================
+# Tests get_task / list_tasks
+# =========================
+
+def test_list_tasks_sweeps_overdue_in_one_call(mock_repository):
+    """Test : list_tasks délègue la mise en retard au repository en un seul appel"""
+    mock_repository.list.return_value = []
+
+    list_tasks(mock_repository)
+
+    mock_repository.mark_overdue_before.assert_called_once_with(date.today())
+    mock_repository.update.assert_not_called()
+
+
+def test_list_tasks_forwards_filters(mock_repository):
+    """Test : les filtres et le curseur sont transmis au repository"""
+    mock_repository.list.return_value = []
+    due_to = date.today()
+
+    list_tasks(mock_repository, status=TaskStatus.DONE, due_to=due_to, limit=10, after_id=42)
+
+    mock_repository.list.assert_called_once_with(
+        status=TaskStatus.DONE,
+        due_from=None,
+        due_to=due_to,
+        limit=10,
+        after_id=42,
+    )
+
+
+def test_export_tasks_streams_from_repository(mock_repository):
+    """Test : export_tasks renvoie le flux du repository sans le matérialiser"""
+    stream = iter([Task(id=1, title="Test")])
+    mock_repository.stream.return_value = stream
+
+    result = export_tasks(mock_repository, status=TaskStatus.IN_PROGRESS)
+
+    assert result is stream
+    mock_repository.mark_overdue_before.assert_called_once_with(date.today())
+    mock_repository.list.assert_not_called()
+
+
+def test_get_task_overdue(mock_repository):
+    """Test : une tâche échue est retournée OVERDUE en une lecture, sans écriture"""
+    yesterday = date.today() - timedelta(days=1)
+    task = Task(id=1, title="Test", status=TaskStatus.IN_PROGRESS, due_date=yesterday)
+    mock_repository.get.return_value = task
+
+    result = get_task(mock_repository, 1)
+
+    assert result.status == TaskStatus.OVERDUE
+    mock_repository.get.assert_called_once_with(1)
+    mock_repository.mark_overdue_before.assert_not_called()
+    mock_repository.update.assert_not_called()
+
+
+def test_get_task_projection_loads_due_date_for_status(mock_repository):
+    """Test : demander le statut charge aussi l'échéance, nécessaire au retard dérivé"""
+    yesterday = date.today() - timedelta(days=1)
+    mock_repository.get_fields.return_value = {"id": 1, "status": TaskStatus.IN_PROGRESS, "due_date": yesterday}
+
+    result = get_task_fields(mock_repository, 1, fields=["status"])
+
+    assert result["status"] == TaskStatus.OVERDUE
+    mock_repository.get_fields.assert_called_once_with(1, {"status", "due_date"})
+    mock_repository.get.assert_not_called()
+
+
+def test_get_task_not_overdue(mock_repository):
+    """Test : une tâche non échue ne déclenche aucune écriture"""
+    task = Task(id=1, title="Test")
+    mock_repository.get.return_value = task
+
+    result = get_task(mock_repository, 1)
+
+    assert result is task
+    mock_repository.mark_overdue_before.assert_not_called()
+
+
 # =========================
 # Tests update_task
 # =========================
@@ -242,3 +330,115 @@ def test_change_task_status_overdue(mock_repository, mock_notifier):
 
     # La teche doit etre OVERDUE automatiquement
     assert updated.status == TaskStatus.OVERDUE
+
+
+# =========================
+# Tests opérations par lot
+# =========================
+
+def test_create_tasks_reports_errors_per_item(mock_repository, mock_notifier):
+    """Test : les éléments invalides sont signalés, les valides insérés en un lot"""
+    created, errors = create_tasks(
+        mock_repository,
+        mock_notifier,
+        [{"title": "Valide"}, {"title": ""}, {"title": "Autre", "description": "A" * 116}],
+    )
+
+    assert [t.title for t in created] == ["Valide"]
+    assert set(errors) == {1, 2}
+    mock_repository.add_many.assert_called_once_with(created)
+    mock_notifier.notify_many.assert_called_once()
+    mock_notifier.notify.assert_not_called()
+
+
+def test_update_tasks_single_fetch_and_write(mock_repository, mock_notifier):
+    """Test : un lot de modifications = une lecture et une écriture"""
+    mock_repository.get_many.return_value = [Task(id=1, title="Un"), Task(id=2, title="Deux")]
+
+    updated, errors = update_tasks(
+        mock_repository,
+        mock_notifier,
+        [{"id": 1, "status": TaskStatus.DONE}, {"id": 2, "title": "Deux bis"}, {"id": 3, "title": "X"}],
+    )
+
+    assert [t.id for t in updated] == [1, 2]
+    assert updated[0].status == TaskStatus.DONE
+    assert errors == {2: "Task not found"}
+    mock_repository.get_many.assert_called_once_with([1, 2, 3])
+    mock_repository.update_many.assert_called_once_with(updated)
+    assert len(mock_notifier.notify_many.call_args.args[0]) == 2
+
+
+def test_update_tasks_keeps_due_date_unless_sent(mock_repository, mock_notifier):
+    """Test : une échéance absente du lot est conservée, due_date None l'efface"""
+    due = date.today() + timedelta(days=3)
+    mock_repository.get_many.return_value = [
+        Task(id=1, title="Un", due_date=due),
+        Task(id=2, title="Deux", due_date=due),
+    ]
+
+    updated, _ = update_tasks(
+        mock_repository,
+        mock_notifier,
+        [{"id": 1, "title": "Un bis"}, {"id": 2, "due_date": None}],
+    )
+
+    assert [t.due_date for t in updated] == [due, None]
+
+
+def test_delete_tasks_not_found(mock_repository, mock_notifier):
+    """Test : les ids inexistants sont signalés, les autres supprimés en un lot"""
+    mock_repository.get_many.return_value = [Task(id=1, title="Un")]
+    mock_repository.delete_many.return_value = [1]
+
+    deleted, errors = delete_tasks(mock_repository, mock_notifier, [1, 2])
+
+    assert deleted == [1]
+    assert errors == {1: "Task not found"}
+    mock_repository.delete_many.assert_called_once_with([1])
+    mock_notifier.notify_many.assert_called_once()
+
+
+# =========================
+# Tests use cases asynchrones
+# =========================
+
+def test_async_change_task_status_matches_sync(mock_notifier):
+    """Test : la version asynchrone applique les mêmes règles de statut"""
+    yesterday = date.today() - timedelta(days=1)
+    repository = AsyncMock()
+    repository.get.return_value = Task(id=1, title="Test", due_date=yesterday, status=TaskStatus.DONE)
+
+    updated = asyncio.run(
+        async_use_cases.change_task_status(repository, mock_notifier, 1, TaskStatus.IN_PROGRESS)
+    )
+
+    assert updated.status == TaskStatus.OVERDUE
+    repository.update.assert_awaited_once_with(updated)
+    mock_notifier.notify.assert_called_once()
+
+
+def test_async_create_tasks_reports_errors_per_item(mock_notifier):
+    """Test : le lot asynchrone valide chaque élément et insère en un appel"""
+    repository = AsyncMock()
+
+    created, errors = asyncio.run(
+        async_use_cases.create_tasks(repository, mock_notifier, [{"title": "Ok"}, {"title": "A" * 31}])
+    )
+
+    assert [t.title for t in created] == ["Ok"]
+    assert list(errors) == [1]
+    repository.add_many.assert_awaited_once_with(created)
+
+
+def test_async_get_task_is_pure_read():
+    """Test : get_task asynchrone dérive le retard sans écrire"""
+    yesterday = date.today() - timedelta(days=1)
+    repository = AsyncMock()
+    repository.get.return_value = Task(id=1, title="Test", due_date=yesterday)
+
+    task = asyncio.run(async_use_cases.get_task(repository, 1))
+
+    assert task.status == TaskStatus.OVERDUE
+    repository.get.assert_awaited_once_with(1)
+    repository.mark_overdue_before.assert_not_called()
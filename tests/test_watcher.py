@@ -0,0 +1,67 @@
+import sys
+import threading
+import pytest
+
+from todo.adapters.notifications import watcher as watcher_module
+from todo.adapters.notifications.notif import Notif
+from todo.adapters.notifications.watcher import FileWatcher
+
+
+@pytest.fixture(params=["inotify", "polling"])
+def mode(request, monkeypatch):
+    if request.param == "inotify" and not sys.platform.startswith("linux"):
+        pytest.skip("inotify uniquement sous Linux")
+    if request.param == "polling":
+        monkeypatch.setattr(watcher_module, "_load_libc", lambda: None)
+    return request.param
+
+
+def start_watcher(path):
+    changed = threading.Event()
+    watcher = FileWatcher(str(path), changed.set, poll_interval=0.02)
+    watcher.start()
+    return watcher, changed
+
+
+# =========================
+# Tests FileWatcher
+# =========================
+
+def test_watcher_sees_external_write(tmp_path, mode):
+    """Test : une écriture d'un autre notifier (autre processus) déclenche le callback"""
+    path = tmp_path / "notifications.txt"
+    watcher, changed = start_watcher(path)
+    try:
+        assert watcher.mode == mode
+        Notif(str(path)).notify("depuis l'API")
+        assert changed.wait(2)
+    finally:
+        watcher.stop()
+
+
+def test_watcher_ignores_other_files(tmp_path, mode):
+    """Test : les autres fichiers du dossier ne déclenchent rien"""
+    watcher, changed = start_watcher(tmp_path / "notifications.txt")
+    try:
+        (tmp_path / "todo.db").write_bytes(b"x")
+        assert not changed.wait(0.2)
+    finally:
+        watcher.stop()
+
+
+# =========================
+# Tests pub/sub
+# =========================
+
+def test_subscribe_receives_written_lines(tmp_path):
+    """Test : les abonnés reçoivent les lignes après écriture, jusqu'au désabonnement"""
+    notif = Notif(str(tmp_path / "notifications.txt"))
+    received = []
+    unsubscribe = notif.subscribe(received.append)
+
+    notif.notify_many(["un", "deux"])
+    unsubscribe()
+    notif.notify("trois")
+
+    assert len(received) == 1
+    assert [line.split("] ", 1)[1] for line in received[0]] == ["un", "deux"]